@@ -0,0 +1,73 @@
+# Import libraries.
+import argparse
+import os
+import tempfile
+import time
+
+from typing import List
+
+import download_dataset
+import generate_synthetic_data
+import mock_socrata_server
+
+
+def main() -> None:
+    """Benchmark single-stream and paged downloads against a local stand-in server."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--rows", type=int, default=200000, help="Rows served.")
+    parser.add_argument(
+        "--page-size", type=int, default=25000, help="Rows per page in paged mode."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Worker counts to benchmark.",
+    )
+    parser.add_argument(
+        "--bytes-per-second",
+        type=float,
+        default=4 * 1024 * 1024,
+        help="Per-connection bandwidth limit of the stand-in server.",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.csv")
+        generate_synthetic_data.generate_csv(source, args.rows)
+        server = mock_socrata_server.start_server(
+            source, bytes_per_second=args.bytes_per_second
+        )
+        endpoint = f"http://127.0.0.1:{server.server_address[1]}/8h9b-rp9u.csv"
+        output = os.path.join(tmp, "download.csv")
+
+        results: List[tuple] = []
+        start = time.perf_counter()
+        download_dataset.stream_download(output, args.rows, endpoint)
+        baseline = time.perf_counter() - start
+        results.append(("single stream", baseline))
+
+        for worker_count in args.workers:
+            # Drop the checkpoint so every run downloads from scratch.
+            os.remove(download_dataset.manifest_path(output))
+            start = time.perf_counter()
+            download_dataset.paged_download(
+                output, args.rows, args.page_size, worker_count, endpoint
+            )
+            results.append(
+                (f"paged, {worker_count} workers", time.perf_counter() - start)
+            )
+
+        server.shutdown()
+
+    print(
+        f"\n{args.rows:,} rows, {args.bytes_per_second / 1024 / 1024:.1f} MiB/s per connection"
+    )
+    print(f"{'Mode':<22}{'Seconds':>10}{'Speedup':>10}")
+    for name, seconds in results:
+        print(f"{name:<22}{seconds:>10.2f}{baseline / seconds:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
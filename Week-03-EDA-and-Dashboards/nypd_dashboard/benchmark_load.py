@@ -0,0 +1,90 @@
+# Import libraries.
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from typing import List
+
+import generate_synthetic_data
+
+# The dashboard module calls Streamlit at import time; outside `streamlit run`
+# that only logs warnings, which would drown the results.
+logging.disable(logging.WARNING)
+import nypd_dashboard  # noqa: E402
+
+
+def main() -> None:
+    """Benchmark the dashboard's CSV loader with the pandas and Arrow engines.
+
+    After the engines, a restart reads the processed frame back from the disk
+    cache written by the previous run, and a progressive load reads the file
+    in batches on a background thread, including the sketches it builds once
+    the last batch is in.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[1000000, 3000000, 6000000],
+        help="Dataset sizes to benchmark.",
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=["pandas", "pyarrow"],
+        default=["pandas", "pyarrow"],
+        help="CSV engines to benchmark; the first one is the baseline.",
+    )
+    args = parser.parse_args()
+
+    results: List[tuple] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        nypd_dashboard.cache_directory = os.path.join(tmp, "cache")
+        for total_rows in args.rows:
+            source = os.path.join(tmp, f"arrests-{total_rows}.csv")
+            generate_synthetic_data.generate_csv(source, total_rows)
+
+            runs = [(engine, engine) for engine in args.engines]
+            runs.append(("disk cache", args.engines[-1]))
+            runs.append(("progressive", args.engines[-1]))
+
+            baseline = None
+            for name, engine in runs:
+                # Start every run from an empty cache; the disk cache run keeps
+                # the files written by the run before it.
+                nypd_dashboard.load_full_nypd_data.clear()
+                if name != "disk cache":
+                    shutil.rmtree(nypd_dashboard.cache_directory, ignore_errors=True)
+                start = time.perf_counter()
+                if name == "progressive":
+                    loader = nypd_dashboard.BackgroundLoader(source, engine=engine)
+                    while not loader.done:
+                        time.sleep(0.01)
+                    if loader.error is not None:
+                        raise loader.error
+                    df = loader.frame
+                    del loader
+                else:
+                    df = nypd_dashboard.load_full_nypd_data(source, engine=engine)
+                seconds = time.perf_counter() - start
+                baseline = baseline or seconds
+                memory = df.memory_usage(deep=True).sum() / 1024 / 1024
+                results.append((total_rows, name, seconds, memory, baseline))
+                del df
+            os.remove(source)
+
+    print(f"\n{os.cpu_count()} CPU cores")
+    print(f"{'Rows':>10}  {'Engine':<12}{'Seconds':>10}{'MiB':>10}{'Speedup':>10}")
+    for total_rows, name, seconds, memory, baseline in results:
+        print(
+            f"{total_rows:>10,}  {name:<12}{seconds:>10.2f}{memory:>10.1f}"
+            f"{baseline / seconds:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
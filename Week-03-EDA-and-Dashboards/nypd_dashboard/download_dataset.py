@@ -1,35 +1,1286 @@
 # Import libraries.
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
 import time
 
+import pandas as pd
+
+from nypd_schema import (
+    arrow_column_types,
+    compression_suffixes,
+    dashboard_columns,
+    detect_compression,
+    partition_column,
+    summary_count_column,
+    summary_groups,
+    summary_rollup_column,
+    summary_rollups,
+)
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
 from requests import get
 from tqdm import tqdm
 
 # Define the file name.
 file_name = "nypd_arrests_dataset.csv"
+# Define the directory of the year-partitioned Parquet dataset.
+parquet_dataset_name = "nypd_arrests_dataset.parquet"
+# Define the file of the grouped-count summary table.
+summary_file_name = "nypd_arrests_summary.parquet"
 # Define the API endpoint's limit string query parameter. How many rows/samples to download from the API.
 limit = 5986025
 # Define the API endpoint.
-url = f"https://data.cityofnewyork.us/resource/8h9b-rp9u.csv?$limit={limit}"
-
-# Start timer and create progress bar.
-start_time = time.time()
-print("Starting download process...")
-
-# Make a GET request with progress tracking.
-with tqdm(total=100, desc="Downloading data from API") as pbar:
-    # Download data.
-    pbar.set_description("Downloading data from API")
-    response = get(url)
-    pbar.update(50)
-    
-    # Save the content to a CSV file.
-    pbar.set_description("Writing data to file")
-    with open(f"{file_name}", "wb") as f:
-        f.write(response.content)
-    pbar.update(50)
-
-# Calculate and display total time.
-end_time = time.time()
-total_time = end_time - start_time
-print(f"Data saved to: {file_name}")
-print(f"Total time to download and save data from API: {total_time:.2f} seconds")
\ No newline at end of file
+base_url = "https://data.cityofnewyork.us/resource/8h9b-rp9u.csv"
+# Define the size of each chunk written to disk while streaming (1 MiB).
+chunk_size = 1024 * 1024
+# Define how long to wait for the server before giving up (connect, read) in seconds.
+request_timeout = (30, 300)
+# Ask the server to gzip the response; requests decompresses it while streaming.
+request_headers = {"Accept-Encoding": "gzip"}
+# Define the compression level of each codec the raw CSV can be stored with.
+compression_levels = {"gzip": 6, "zstd": 3}
+# Define the paged download defaults: rows per page, parallel requests and a stable sort order.
+page_size = 250000
+workers = 4
+order = ":id"
+# Define how many times pages that came back short are downloaded again.
+page_retries = 3
+# Define the number of rows per Parquet row group.
+row_group_rows = 128 * 1024
+# Define the columns used by the delta sync: the arrest date watermark and the unique row key.
+date_column = "arrest_date"
+key_column = "arrest_key"
+# Define how many rows are read at a time when scanning a downloaded file.
+scan_rows = 500000
+
+
+def build_url(
+    row_limit: int,
+    endpoint: str = base_url,
+    offset: int = 0,
+    sort_order: Optional[str] = None,
+    where: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    group: Optional[List[str]] = None,
+) -> str:
+    """Build the API URL for a single request.
+
+    Parameters
+    ----------
+    row_limit : int
+        Number of rows to request from the API.
+    endpoint : str
+        Base URL of the Socrata resource.
+    offset : int
+        Number of rows to skip before the first returned row.
+    sort_order : Optional[str]
+        SoQL ``$order`` clause. Paged requests need a stable order, otherwise
+        pages may overlap or miss rows.
+    where : Optional[str]
+        SoQL ``$where`` filter.
+    columns : Optional[List[str]]
+        Columns to request (SoQL ``$select``). ``None`` requests every column.
+    group : Optional[List[str]]
+        SoQL ``$group`` expressions, for aggregate queries.
+
+    Returns
+    -------
+    str
+        Full URL including the SoQL query parameters.
+    """
+    params = {"$limit": row_limit}
+    if offset:
+        params["$offset"] = offset
+    if sort_order:
+        params["$order"] = sort_order
+    if where:
+        params["$where"] = where
+    if columns:
+        params["$select"] = ",".join(columns)
+    if group:
+        params["$group"] = ",".join(group)
+    return f"{endpoint}?{urlencode(params, safe='$:,')}"
+
+
+def page_windows(total_rows: int, rows_per_page: int) -> List[Tuple[int, int, int]]:
+    """Split a download into ``$offset``/``$limit`` windows.
+
+    Parameters
+    ----------
+    total_rows : int
+        Total number of rows to download.
+    rows_per_page : int
+        Number of rows requested per page.
+
+    Returns
+    -------
+    List[Tuple[int, int, int]]
+        ``(page_index, offset, limit)`` for every page, in file order.
+    """
+    return [
+        (index, offset, min(rows_per_page, total_rows - offset))
+        for index, offset in enumerate(range(0, total_rows, rows_per_page))
+    ]
+
+
+def truncated_pages(
+    windows: List[Tuple[int, int, int]], pages: Dict[str, int]
+) -> List[int]:
+    """Find downloaded pages that hold fewer rows than they asked for.
+
+    Parameters
+    ----------
+    windows : List[Tuple[int, int, int]]
+        Page windows from ``page_windows``.
+    pages : Dict[str, int]
+        Rows written per page index, as recorded in the manifest.
+
+    Returns
+    -------
+    List[int]
+        Indexes of the pages whose row count differs from their ``$limit``
+        although a later page has rows. Only the pages after the end of the
+        dataset may legitimately come back short (or empty).
+    """
+    filled = [index for index, _, _ in windows if pages.get(str(index), 0) > 0]
+    last = max(filled, default=-1)
+    return [
+        index
+        for index, _, page_limit in windows
+        if index < last and pages.get(str(index)) != page_limit
+    ]
+
+
+def manifest_path(file_path: str) -> str:
+    """Return the path of the checkpoint manifest stored next to ``file_path``."""
+    return f"{file_path}.manifest.json"
+
+
+def load_manifest(file_path: str) -> Dict[str, Any]:
+    """Load the checkpoint manifest of a download.
+
+    Parameters
+    ----------
+    file_path : str
+        Output file of the download.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The manifest, or an empty dict if there is none or it cannot be read.
+    """
+    try:
+        with open(manifest_path(file_path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(file_path: str, manifest: Dict[str, Any]) -> None:
+    """Atomically write the checkpoint manifest of a download.
+
+    Parameters
+    ----------
+    file_path : str
+        Output file of the download.
+    manifest : Dict[str, Any]
+        Manifest contents.
+
+    Returns
+    -------
+    None
+        The manifest is written next to ``file_path``.
+    """
+    path = manifest_path(file_path)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+
+def start_manifest(file_path: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the manifest to continue from, or a fresh one.
+
+    Parameters
+    ----------
+    file_path : str
+        Output file of the download.
+    settings : Dict[str, Any]
+        Settings that define the download (mode, endpoint, order, sizes). A
+        saved manifest is only reused if all of them match, so changing any
+        option starts the download from scratch.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Manifest with ``settings``, the completed ``pages`` and a ``complete`` flag.
+    """
+    manifest = load_manifest(file_path)
+    if manifest.get("settings") != settings:
+        manifest = {"settings": settings, "pages": {}, "complete": False}
+    return manifest
+
+
+def is_complete(file_path: str, manifest: Dict[str, Any]) -> bool:
+    """Check whether a manifest describes a finished download still on disk."""
+    if not manifest.get("complete"):
+        return False
+    if manifest["settings"].get("keep_parts"):
+        compression = manifest["settings"].get("compression")
+        return all(
+            os.path.exists(page_path(file_path, int(index), compression))
+            for index in manifest["pages"]
+        )
+    return os.path.exists(file_path) and os.path.getsize(file_path) == manifest.get(
+        "bytes"
+    )
+
+
+def manifest_matches(file_path: str, manifest: Dict[str, Any]) -> bool:
+    """Check whether a manifest describes exactly the file now on disk.
+
+    Parameters
+    ----------
+    file_path : str
+        Downloaded CSV file.
+    manifest : Dict[str, Any]
+        Its manifest, from ``load_manifest``.
+
+    Returns
+    -------
+    bool
+        True if the download is complete, its statistics were recorded, and
+        the file still has the size and modification time recorded with them.
+        Any later change to the file (other than through ``--sync``, which
+        updates the manifest) makes the manifest stale.
+    """
+    if not manifest.get("complete") or "sha256" not in manifest:
+        return False
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return False
+    return stat.st_size == manifest.get("bytes") and stat.st_mtime == manifest.get(
+        "mtime"
+    )
+
+
+def file_checksum(file_path: str) -> str:
+    """Return the SHA-256 hex digest of a file, read in ``chunk_size`` blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def column_statistics(frame: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Compute basic statistics of every column of a frame of raw text values.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        Rows read with ``dtype=str``, so missing values are NaN.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        Per column: ``nulls`` (missing values), ``numeric`` (every present
+        value parses as a number) and ``min``/``max`` (as numbers for numeric
+        columns, else as text; ``None`` if the column has no values).
+    """
+    stats = {}
+    for column in frame.columns:
+        present = frame[column].dropna()
+        # Text columns are recognised from their first values, without parsing all of them.
+        numeric = not pd.to_numeric(present.iloc[:100], errors="coerce").isna().any()
+        if numeric:
+            numbers = pd.to_numeric(present, errors="coerce")
+            numeric = not numbers.isna().any()
+        values = numbers if numeric else present
+        empty = len(values) == 0
+        stats[column] = {
+            "nulls": int(len(frame) - len(present)),
+            "numeric": numeric,
+            "min": None if empty else (float if numeric else str)(values.min()),
+            "max": None if empty else (float if numeric else str)(values.max()),
+        }
+    return stats
+
+
+def merge_column_statistics(
+    left: Dict[str, Dict[str, Any]], right: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """Combine the column statistics of two parts of the same file.
+
+    Parameters
+    ----------
+    left, right : Dict[str, Dict[str, Any]]
+        Statistics from ``column_statistics``.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        Statistics of both parts together. If a column is numeric in one part
+        but not in the other, its range is unknown and set to ``None``.
+    """
+    merged = {}
+    for column in list(left) + [c for c in right if c not in left]:
+        parts = [
+            stats[column]
+            for stats in (left, right)
+            if column in stats and stats[column]["min"] is not None
+        ]
+        nulls = sum(
+            stats[column]["nulls"] for stats in (left, right) if column in stats
+        )
+        if not parts:
+            merged[column] = {"nulls": nulls, "numeric": True, "min": None, "max": None}
+        elif len({part["numeric"] for part in parts}) > 1:
+            merged[column] = {
+                "nulls": nulls,
+                "numeric": False,
+                "min": None,
+                "max": None,
+            }
+        else:
+            merged[column] = {
+                "nulls": nulls,
+                "numeric": parts[0]["numeric"],
+                "min": min(part["min"] for part in parts),
+                "max": max(part["max"] for part in parts),
+            }
+    return merged
+
+
+def describe_file(file_path: str, manifest: Dict[str, Any]) -> None:
+    """Record the integrity details of a finished download in its manifest.
+
+    Parameters
+    ----------
+    file_path : str
+        Downloaded CSV file, plain or compressed.
+    manifest : Dict[str, Any]
+        Manifest to update in place: ``bytes``, ``mtime``, ``sha256`` (of the
+        stored file), ``schema`` (column names in file order) and ``columns``
+        (per-column statistics).
+
+    Returns
+    -------
+    None
+        The manifest is updated but not saved.
+
+    Purpose
+    -------
+    The file is read once, in chunks of ``scan_rows`` rows, right after it is
+    downloaded. The dashboard trusts a manifest that still matches the file
+    (see ``manifest_matches``), so it can skip checks the statistics already
+    answer instead of re-deriving them on every cold start.
+    """
+    stats: Dict[str, Dict[str, Any]] = {}
+    schema: List[str] = []
+    for chunk in pd.read_csv(
+        file_path,
+        dtype=str,
+        chunksize=scan_rows,
+        compression=detect_compression(file_path),
+    ):
+        schema = list(chunk.columns)
+        stats = merge_column_statistics(stats, column_statistics(chunk))
+    stat = os.stat(file_path)
+    manifest.update(
+        bytes=stat.st_size,
+        mtime=stat.st_mtime,
+        sha256=file_checksum(file_path),
+        schema=schema,
+        columns=stats,
+    )
+
+
+def open_output(
+    path: str, compression: Optional[str] = None, append: bool = False
+) -> BinaryIO:
+    """Open a file for binary writing, compressing everything written to it.
+
+    Parameters
+    ----------
+    path : str
+        File to write.
+    compression : Optional[str]
+        ``"gzip"``, ``"zstd"`` or ``None`` for an uncompressed file.
+    append : bool
+        If True, add to the end of the file. Compressed files get a new gzip
+        member or zstd frame, which readers decode as one continuous stream.
+
+    Returns
+    -------
+    BinaryIO
+        Writable file object.
+    """
+    mode = "ab" if append else "wb"
+    if compression == "gzip":
+        return gzip.open(path, mode, compresslevel=compression_levels["gzip"])
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.open(
+            path, mode, cctx=zstandard.ZstdCompressor(level=compression_levels["zstd"])
+        )
+    return open(path, mode)
+
+
+def _stream_to_file(
+    url: str,
+    part_path: str,
+    chunk_bytes: int,
+    pbar: tqdm,
+    pbar_lock: Optional[threading.Lock] = None,
+    append: bool = False,
+    compression: Optional[str] = None,
+    digest: Optional[Any] = None,
+) -> int:
+    """Write one HTTP response to ``part_path`` chunk by chunk.
+
+    With ``append=True`` the response is added to the end of ``part_path`` and
+    its header line is dropped. With ``compression`` set, the file is written
+    through that codec. If a ``hashlib`` object is given as ``digest``, it is
+    updated with the (uncompressed) bytes written. Returns the number of data
+    rows written, excluding the header line.
+    """
+    rows = -1  # The first line is the CSV header.
+
+    with get(
+        url, stream=True, timeout=request_timeout, headers=request_headers
+    ) as response:
+        response.raise_for_status()
+        with open_output(part_path, compression, append) as f:
+            for chunk in response.iter_content(chunk_size=chunk_bytes):
+                if not chunk:
+                    continue
+                if rows < 0 and append:
+                    # Still inside the header line of a resumed request.
+                    _, newline, chunk = chunk.partition(b"\n")
+                    if newline:
+                        rows = 0
+                    if not chunk:
+                        continue
+                f.write(chunk)
+                if digest is not None:
+                    digest.update(chunk)
+                new_rows = chunk.count(b"\n")
+                if rows < 0 and new_rows > 0:
+                    new_rows -= 1
+                    rows = 0
+                rows += new_rows
+                if pbar_lock is None:
+                    pbar.update(new_rows)
+                else:
+                    with pbar_lock:
+                        pbar.update(new_rows)
+
+    return max(rows, 0)
+
+
+def _trim_partial_file(part_path: str) -> int:
+    """Cut a partial download back to its last complete line.
+
+    Returns the number of complete data rows left in the file. Rows are
+    counted by line breaks; the arrests export has no embedded newlines.
+    """
+    rows = -1
+    last_newline = 0
+    position = 0
+    with open(part_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            count = chunk.count(b"\n")
+            if count:
+                rows += count
+                last_newline = position + chunk.rindex(b"\n") + 1
+            position += len(chunk)
+    with open(part_path, "r+b") as f:
+        f.truncate(last_newline)
+    return max(rows, 0)
+
+
+def stream_download(
+    file_path: str,
+    total_rows: int,
+    endpoint: str = base_url,
+    sort_order: str = order,
+    chunk_bytes: int = chunk_size,
+    columns: Optional[List[str]] = None,
+    compression: Optional[str] = None,
+) -> int:
+    """Stream the API response to disk in fixed-size chunks.
+
+    Parameters
+    ----------
+    file_path : str
+        Destination file. Data is written to ``file_path + ".part"`` and only
+        moved into place once the download completes.
+    total_rows : int
+        Number of rows to download.
+    endpoint : str
+        Base URL of the Socrata resource.
+    sort_order : str
+        SoQL ``$order`` clause, so an interrupted download can be resumed by offset.
+    chunk_bytes : int
+        Size of each chunk read from the socket and written to disk.
+    columns : Optional[List[str]]
+        Columns to download (SoQL ``$select``). ``None`` downloads every column.
+    compression : Optional[str]
+        Store the file compressed with ``"gzip"`` or ``"zstd"``.
+
+    Returns
+    -------
+    int
+        Number of data rows written (excluding the header line).
+
+    Purpose
+    -------
+    The response body is never held in memory as a whole: each chunk is written
+    as soon as it arrives, so peak memory stays at roughly ``chunk_bytes``
+    regardless of the dataset size. Progress is reported in rows by counting
+    line breaks in each chunk. If a previous run with the same settings left a
+    partial file behind, the download continues from its last complete row.
+    A partial compressed file cannot be cut back to a complete row, so a
+    compressed download starts over instead.
+    """
+    part_path = f"{file_path}.part"
+    settings = {
+        "mode": "stream",
+        "url": endpoint,
+        "order": sort_order,
+        "total_rows": total_rows,
+        "columns": columns,
+        "compression": compression,
+    }
+    manifest = start_manifest(file_path, settings)
+    if is_complete(file_path, manifest):
+        print(f"{file_path} is already complete, nothing to download.")
+        return manifest["rows"]
+
+    done_rows = 0
+    if (
+        manifest["pages"]
+        and not manifest["complete"]
+        and compression is None
+        and os.path.exists(part_path)
+    ):
+        done_rows = _trim_partial_file(part_path)
+    manifest.update(pages={"0": done_rows}, complete=False)
+    save_manifest(file_path, manifest)
+
+    with tqdm(
+        total=total_rows,
+        initial=done_rows,
+        unit=" rows",
+        unit_scale=True,
+        desc="Downloading",
+    ) as pbar:
+        url = build_url(
+            total_rows - done_rows, endpoint, done_rows, sort_order, columns=columns
+        )
+        rows = done_rows + _stream_to_file(
+            url,
+            part_path,
+            chunk_bytes,
+            pbar,
+            append=done_rows > 0,
+            compression=compression,
+        )
+
+    # Only replace the previous file once the new one is complete.
+    os.replace(part_path, file_path)
+    manifest.update(pages={"0": rows}, complete=True, rows=rows)
+    describe_file(file_path, manifest)
+    save_manifest(file_path, manifest)
+    return rows
+
+
+def parquet_download(
+    dataset_path: str,
+    total_rows: int,
+    endpoint: str = base_url,
+    sort_order: str = order,
+    chunk_bytes: int = chunk_size,
+    compression: str = "zstd",
+    columns: Optional[List[str]] = None,
+) -> int:
+    """Stream the API response straight into a year-partitioned Parquet dataset.
+
+    Parameters
+    ----------
+    dataset_path : str
+        Destination directory. Files are laid out as
+        ``<dataset_path>/arrest_year=<year>/part-0.parquet``. Rows without a
+        valid arrest date go to ``arrest_year=0``.
+    total_rows : int
+        Number of rows to download.
+    endpoint : str
+        Base URL of the Socrata resource.
+    sort_order : str
+        SoQL ``$order`` clause.
+    chunk_bytes : int
+        Size of each CSV block parsed from the stream.
+    compression : str
+        Parquet compression codec.
+    columns : Optional[List[str]]
+        Columns to download (SoQL ``$select``). ``arrest_date`` is added if
+        missing, as the dataset is partitioned by it.
+
+    Returns
+    -------
+    int
+        Number of rows written.
+
+    Purpose
+    -------
+    The CSV is parsed block by block as it arrives, with the column types from
+    ``nypd_schema``: typed numbers and timestamps, and dictionary-encoded
+    categorical columns. Each block is split by arrest year and appended to that
+    year's Parquet file, so memory stays bounded and the dashboard can skip
+    years outside its date range without reading them.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    import pyarrow as pa
+
+    # The rows are split by arrest year, so the date is always downloaded.
+    if columns and date_column not in columns:
+        columns = [date_column] + columns
+
+    part_path = f"{dataset_path}.part"
+    shutil.rmtree(part_path, ignore_errors=True)
+    writers: Dict[int, Any] = {}
+    # Rows of each year are buffered so every row group holds about row_group_rows rows.
+    buffers: Dict[int, List[Any]] = {}
+    rows = 0
+
+    def flush(year: int) -> None:
+        table = pa.Table.from_batches(buffers.pop(year))
+        if year not in writers:
+            year_path = os.path.join(part_path, f"{partition_column}={year}")
+            os.makedirs(year_path)
+            writers[year] = pq.ParquetWriter(
+                os.path.join(year_path, "part-0.parquet"),
+                table.schema,
+                compression=compression,
+            )
+        writers[year].write_table(table)
+
+    url = build_url(total_rows, endpoint, sort_order=sort_order, columns=columns)
+    with get(
+        url, stream=True, timeout=request_timeout, headers=request_headers
+    ) as response, tqdm(
+        total=total_rows, unit=" rows", unit_scale=True, desc="Downloading"
+    ) as pbar:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        reader = pa_csv.open_csv(
+            response.raw,
+            read_options=pa_csv.ReadOptions(block_size=chunk_bytes),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=arrow_column_types(), strings_can_be_null=True
+            ),
+        )
+        try:
+            for batch in reader:
+                years = pc.fill_null(pc.year(batch["arrest_date"]), 0)
+                for year in pc.unique(years).to_pylist():
+                    buffers.setdefault(year, []).append(
+                        batch.filter(pc.equal(years, year))
+                    )
+                    if sum(b.num_rows for b in buffers[year]) >= row_group_rows:
+                        flush(year)
+                rows += batch.num_rows
+                pbar.update(batch.num_rows)
+            for year in list(buffers):
+                flush(year)
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+    # Only replace the previous dataset once the new one is complete.
+    shutil.rmtree(dataset_path, ignore_errors=True)
+    os.replace(part_path, dataset_path)
+    return rows
+
+
+def summary_download(
+    file_path: str, endpoint: str = base_url, chunk_bytes: int = chunk_size
+) -> int:
+    """Download grouped arrest counts into a compact summary table.
+
+    Parameters
+    ----------
+    file_path : str
+        Destination Parquet file.
+    endpoint : str
+        Base URL of the Socrata resource.
+    chunk_bytes : int
+        Size of each chunk written to disk while streaming.
+
+    Returns
+    -------
+    int
+        Number of rows in the summary table.
+
+    Purpose
+    -------
+    The borough, yearly, monthly, day-of-week and demographic views only need
+    counts. For each rollup in ``nypd_schema.summary_rollups`` the server
+    groups the arrests by its expressions from ``summary_groups`` and returns
+    ``count(*)`` per group, so only the groups travel over the network instead
+    of every arrest. The rollups are stacked into one Parquet table, with the
+    rollup name in ``summary_rollup_column`` and missing values in the columns
+    a rollup does not group by, and categorical text columns so the dashboard
+    can start from it almost instantly.
+    """
+    part_path = f"{file_path}.part.csv"
+    rollups = []
+    with tqdm(unit=" groups", unit_scale=True, desc="Downloading summary") as pbar:
+        for name, keys in summary_rollups.items():
+            # Plain columns keep their own name; SoQL rejects aliases equal to a column name.
+            expressions = {key: summary_groups[key] for key in keys}
+            select = [
+                expression if expression == key else f"{expression} AS {key}"
+                for key, expression in expressions.items()
+            ]
+            url = build_url(
+                limit,
+                endpoint,
+                columns=select + [f"count(*) AS {summary_count_column}"],
+                group=list(expressions.values()),
+            )
+            _stream_to_file(url, part_path, chunk_bytes, pbar)
+            rollups.append(
+                pd.read_csv(part_path).assign(**{summary_rollup_column: name})
+            )
+    os.remove(part_path)
+
+    summary = pd.concat(rollups, ignore_index=True)
+    for column in ["year", "month", "day_of_week", summary_count_column]:
+        summary[column] = pd.to_numeric(summary[column], downcast="integer")
+    for column in summary.columns:
+        if not pd.api.types.is_numeric_dtype(summary[column]):
+            summary[column] = summary[column].astype("category")
+    summary.to_parquet(f"{file_path}.part", index=False, compression="zstd")
+    os.replace(f"{file_path}.part", file_path)
+    return len(summary)
+
+
+def parts_directory(file_path: str) -> str:
+    """Return the directory holding the page files of a paged download."""
+    return f"{file_path}.parts"
+
+
+def page_path(
+    file_path: str, page_index: int, compression: Optional[str] = None
+) -> str:
+    """Return the path of one page file of a paged download."""
+    suffix = compression_suffixes.get(compression, "")
+    return os.path.join(
+        parts_directory(file_path), f"page-{page_index:05d}.csv{suffix}"
+    )
+
+
+def merge_pages(
+    file_path: str, page_files: List[str], compression: Optional[str] = None
+) -> None:
+    """Concatenate page files, in order, into a single CSV.
+
+    Parameters
+    ----------
+    file_path : str
+        Destination CSV file.
+    page_files : List[str]
+        Uncompressed page files in file order. Every page carries its own
+        header line; only the first one is kept.
+    compression : Optional[str]
+        Compress the merged file with ``"gzip"`` or ``"zstd"``.
+
+    Returns
+    -------
+    None
+        The merged file is written to ``file_path``.
+    """
+    part_path = f"{file_path}.part"
+    with open_output(part_path, compression) as out:
+        for index, path in enumerate(page_files):
+            with open(path, "rb") as page:
+                header = page.readline()
+                if index == 0:
+                    out.write(header)
+                shutil.copyfileobj(page, out, chunk_size)
+    os.replace(part_path, file_path)
+
+
+def paged_download(
+    file_path: str,
+    total_rows: int,
+    rows_per_page: int = page_size,
+    max_workers: int = workers,
+    endpoint: str = base_url,
+    sort_order: str = order,
+    keep_parts: bool = False,
+    chunk_bytes: int = chunk_size,
+    columns: Optional[List[str]] = None,
+    compression: Optional[str] = None,
+) -> int:
+    """Download the dataset as parallel ``$offset``/``$limit`` pages.
+
+    Parameters
+    ----------
+    file_path : str
+        Destination CSV file.
+    total_rows : int
+        Total number of rows to download.
+    rows_per_page : int
+        Number of rows requested per page.
+    max_workers : int
+        Number of pages downloaded at the same time.
+    endpoint : str
+        Base URL of the Socrata resource.
+    sort_order : str
+        SoQL ``$order`` clause that keeps pages stable between requests.
+    keep_parts : bool
+        If True, leave the page files in ``<file_path>.parts/`` instead of
+        merging them into ``file_path``.
+    chunk_bytes : int
+        Size of each chunk written to disk while streaming a page.
+    columns : Optional[List[str]]
+        Columns to download (SoQL ``$select``). ``None`` downloads every column.
+    compression : Optional[str]
+        Store the merged file compressed with ``"gzip"`` or ``"zstd"``. Pages
+        are downloaded uncompressed and compressed while merging; with
+        ``keep_parts`` every page file is compressed instead.
+
+    Returns
+    -------
+    int
+        Number of data rows downloaded.
+
+    Purpose
+    -------
+    A single request is limited by one TCP stream. Splitting the download into
+    pages and fetching several at once spreads it over multiple connections.
+    Each page is streamed to its own file so memory stays bounded, and the
+    pages are put back together in offset order at the end. Finished pages are
+    recorded in the checkpoint manifest, so a restarted download only fetches
+    the pages that are still missing. A page with fewer rows than requested
+    before the end of the dataset (see ``truncated_pages``) is dropped from the
+    manifest and fetched again, up to ``page_retries`` times.
+    """
+    windows = page_windows(total_rows, rows_per_page)
+    settings = {
+        "mode": "paged",
+        "url": endpoint,
+        "order": sort_order,
+        "total_rows": total_rows,
+        "page_size": rows_per_page,
+        "keep_parts": keep_parts,
+        "columns": columns,
+        "compression": compression,
+    }
+    manifest = start_manifest(file_path, settings)
+    if is_complete(file_path, manifest):
+        print(f"{file_path} is already complete, nothing to download.")
+        return manifest["rows"]
+
+    # Page files are only compressed when they are kept.
+    page_compression = compression if keep_parts else None
+
+    # Pages recorded in the manifest whose files are still on disk are done.
+    done_pages = {
+        int(index): rows
+        for index, rows in manifest["pages"].items()
+        if os.path.exists(page_path(file_path, int(index), page_compression))
+    }
+    manifest.update(
+        pages={str(index): rows for index, rows in done_pages.items()}, complete=False
+    )
+    manifest["checksums"] = {
+        index: checksum
+        for index, checksum in manifest.get("checksums", {}).items()
+        if int(index) in done_pages
+    }
+    pending = [window for window in windows if window[0] not in done_pages]
+
+    os.makedirs(parts_directory(file_path), exist_ok=True)
+    save_manifest(file_path, manifest)
+    pbar_lock = threading.Lock()
+    manifest_lock = threading.Lock()
+
+    with tqdm(
+        total=total_rows,
+        initial=sum(done_pages.values()),
+        unit=" rows",
+        unit_scale=True,
+        desc="Downloading pages",
+    ) as pbar:
+
+        def fetch(window: Tuple[int, int, int]) -> int:
+            index, offset, page_limit = window
+            url = build_url(page_limit, endpoint, offset, sort_order, columns=columns)
+            path = page_path(file_path, index, page_compression)
+            digest = hashlib.sha256()
+            rows = _stream_to_file(
+                url,
+                f"{path}.part",
+                chunk_bytes,
+                pbar,
+                pbar_lock,
+                compression=page_compression,
+                digest=digest,
+            )
+            os.replace(f"{path}.part", path)
+            with manifest_lock:
+                manifest["pages"][str(index)] = rows
+                manifest.setdefault("checksums", {})[str(index)] = digest.hexdigest()
+                save_manifest(file_path, manifest)
+            return rows
+
+        for attempt in range(page_retries + 1):
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                list(pool.map(fetch, pending))
+            truncated = truncated_pages(windows, manifest["pages"])
+            if not truncated:
+                break
+            # Forget the short pages, so they are fetched again now or on resume.
+            for index in truncated:
+                pbar.update(-manifest["pages"].pop(str(index)))
+                manifest["checksums"].pop(str(index), None)
+                os.remove(page_path(file_path, index, page_compression))
+            save_manifest(file_path, manifest)
+            if attempt == page_retries:
+                raise RuntimeError(
+                    f"Pages {truncated} of {file_path} came back short after "
+                    f"{page_retries} retries; run the download again to resume."
+                )
+            pending = [window for window in windows if window[0] in truncated]
+
+    rows = sum(manifest["pages"].values())
+    manifest.update(complete=True, rows=rows)
+    if not keep_parts:
+        page_files = [page_path(file_path, index) for index, _, _ in windows]
+        merge_pages(file_path, page_files, compression)
+        shutil.rmtree(parts_directory(file_path))
+        describe_file(file_path, manifest)
+    save_manifest(file_path, manifest)
+
+    return rows
+
+
+def scan_sync_state(file_path: str) -> Dict[str, Any]:
+    """Derive the delta sync watermark from a local CSV.
+
+    Parameters
+    ----------
+    file_path : str
+        Local copy of the dataset.
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``max_arrest_date`` (the newest arrest date stored) and
+        ``boundary_keys`` (the arrest keys stored for that date).
+
+    Purpose
+    -------
+    Used the first time a file is synced, or when its manifest was lost. Only
+    the key and date columns are read, in chunks, so memory stays bounded.
+    """
+    max_date = ""
+    keys: set = set()
+    for chunk in pd.read_csv(
+        file_path,
+        usecols=[key_column, date_column],
+        dtype=str,
+        chunksize=500000,
+        compression=detect_compression(file_path),
+    ):
+        chunk_max = chunk[date_column].max()
+        if not isinstance(chunk_max, str) or chunk_max < max_date:
+            continue
+        if chunk_max > max_date:
+            max_date, keys = chunk_max, set()
+        keys.update(chunk.loc[chunk[date_column] == max_date, key_column])
+    return {"max_arrest_date": max_date, "boundary_keys": sorted(keys)}
+
+
+def delta_sync(
+    file_path: str, endpoint: str = base_url, chunk_bytes: int = chunk_size
+) -> int:
+    """Append rows published since the last download or sync to the local CSV.
+
+    Parameters
+    ----------
+    file_path : str
+        Local copy of the dataset, as written by a full download.
+    endpoint : str
+        Base URL of the Socrata resource.
+    chunk_bytes : int
+        Size of each chunk written to disk while streaming.
+
+    Returns
+    -------
+    int
+        Number of new rows appended.
+
+    Purpose
+    -------
+    Only the newest days of the dataset change between refreshes. The manifest
+    remembers the newest ``arrest_date`` stored locally and the arrest keys
+    stored for that date. A sync requests ``$where=arrest_date >= <watermark>``,
+    drops rows whose key is already stored, and appends the rest to the CSV in
+    the local column order. Only the columns already in the local file are
+    requested, so a projected download stays projected. The watermark date itself is re-requested because
+    late rows for that day may have been published after the last sync. A
+    compressed file stays compressed: new rows are appended as a new gzip
+    member or zstd frame.
+    """
+    manifest = load_manifest(file_path)
+    compression = detect_compression(file_path)
+    state = manifest.get("sync") or scan_sync_state(file_path)
+    where = (
+        f"{date_column} >= '{state['max_arrest_date']}'"
+        if state["max_arrest_date"]
+        else None
+    )
+    local_columns = list(
+        pd.read_csv(file_path, nrows=0, compression=compression).columns
+    )
+    url = build_url(
+        limit,
+        endpoint,
+        sort_order=f"{date_column},{key_column}",
+        where=where,
+        columns=local_columns,
+    )
+
+    delta_path = f"{file_path}.delta.part"
+    with tqdm(unit=" rows", unit_scale=True, desc="Downloading new rows") as pbar:
+        _stream_to_file(url, delta_path, chunk_bytes, pbar)
+    delta = pd.read_csv(delta_path, dtype=str, keep_default_na=False)
+    os.remove(delta_path)
+
+    stored_keys = set(state["boundary_keys"])
+    delta = delta[~delta[key_column].isin(stored_keys)].drop_duplicates(key_column)
+
+    if len(delta) > 0:
+        # Keep the column order of the local file.
+        delta.reindex(columns=local_columns, fill_value="").to_csv(
+            file_path,
+            mode="a",
+            header=False,
+            index=False,
+            lineterminator="\n",
+            compression=compression,
+        )
+
+        new_max = delta[date_column].max()
+        new_keys = set(delta.loc[delta[date_column] == new_max, key_column])
+        if new_max == state["max_arrest_date"]:
+            new_keys |= stored_keys
+        state = {"max_arrest_date": new_max, "boundary_keys": sorted(new_keys)}
+
+    # Keep a completed download manifest valid for the grown file.
+    if manifest.get("complete"):
+        manifest["rows"] = manifest["rows"] + len(delta)
+        if "columns" in manifest:
+            # Only the new rows are scanned; empty fields are missing values.
+            stat = os.stat(file_path)
+            manifest.update(
+                bytes=stat.st_size,
+                mtime=stat.st_mtime,
+                sha256=file_checksum(file_path),
+                columns=merge_column_statistics(
+                    manifest["columns"], column_statistics(delta.mask(delta == ""))
+                ),
+            )
+        else:
+            manifest["bytes"] = os.path.getsize(file_path)
+    manifest["sync"] = state
+    save_manifest(file_path, manifest)
+    return len(delta)
+
+
+def main() -> None:
+    """Download the NYPD arrests dataset from the NYC Open Data API.
+
+    Parameters
+    ----------
+    None
+        Options are read from the command line.
+
+    Returns
+    -------
+    None
+        The dataset is written to disk.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output",
+        default=None,
+        help=f"Output file (default: {file_name} plus the --compression suffix, "
+        f"or {parquet_dataset_name} with --format parquet).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Store a CSV file or a year-partitioned Parquet dataset.",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["none", "gzip", "zstd"],
+        default="none",
+        help="Store the CSV compressed (.gz or .zst). The dashboard reads it directly.",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=limit, help="Number of rows to download."
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=chunk_size,
+        help="Bytes written to disk per chunk while streaming.",
+    )
+    parser.add_argument("--url", default=base_url, help="Socrata resource URL.")
+    parser.add_argument(
+        "--paged",
+        action="store_true",
+        help="Download in parallel $offset/$limit pages instead of one request.",
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=page_size, help="Rows per page."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=workers, help="Pages downloaded in parallel."
+    )
+    parser.add_argument(
+        "--order",
+        default=order,
+        help="Stable $order clause used for paging and resuming.",
+    )
+    parser.add_argument(
+        "--keep-parts",
+        action="store_true",
+        help="Keep one CSV per page in <output>.parts/ instead of merging.",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Only fetch rows newer than the local copy and append them to it.",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help=f"Download grouped arrest counts into {summary_file_name} "
+        "instead of the raw rows.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check the output file against the checksum in its manifest instead "
+        "of downloading.",
+    )
+    parser.add_argument(
+        "--select",
+        default=None,
+        help="Comma-separated columns to download ($select), or 'dashboard' for "
+        "only the columns the dashboard uses. Default: every column.",
+    )
+    args = parser.parse_args()
+    compression = None if args.compression == "none" else args.compression
+    if args.output is None and args.summary:
+        args.output = summary_file_name
+    elif args.output is None and args.format == "parquet":
+        args.output = parquet_dataset_name
+    elif args.output is None:
+        args.output = file_name + compression_suffixes.get(compression, "")
+    if args.select == "dashboard":
+        columns = dashboard_columns
+    elif args.select:
+        columns = [column.strip() for column in args.select.split(",")]
+    else:
+        columns = None
+    if args.format == "parquet" and (args.paged or args.sync):
+        parser.error("--format parquet only supports the single-stream download.")
+    if compression and (args.format == "parquet" or args.summary):
+        parser.error("--compression only applies to CSV downloads.")
+
+    if args.verify:
+        manifest = load_manifest(args.output)
+        if "sha256" not in manifest:
+            parser.error(f"{args.output} has no manifest with a checksum.")
+        if file_checksum(args.output) != manifest["sha256"]:
+            parser.exit(1, f"{args.output} does not match its manifest.\n")
+        print(f"{args.output} matches its manifest ({manifest['rows']:,} rows).")
+        return
+
+    # Start timer.
+    start_time = time.time()
+    print("Starting download process...")
+
+    if args.summary:
+        rows = summary_download(args.output, args.url, args.chunk_size)
+    elif args.sync:
+        if not os.path.exists(args.output):
+            parser.error(f"{args.output} not found; run a full download first.")
+        rows = delta_sync(args.output, args.url, args.chunk_size)
+    elif args.format == "parquet":
+        rows = parquet_download(
+            args.output,
+            args.limit,
+            args.url,
+            args.order,
+            args.chunk_size,
+            columns=columns,
+        )
+    elif args.paged:
+        rows = paged_download(
+            args.output,
+            args.limit,
+            args.page_size,
+            args.workers,
+            args.url,
+            args.order,
+            args.keep_parts,
+            args.chunk_size,
+            columns,
+            compression,
+        )
+    else:
+        rows = stream_download(
+            args.output,
+            args.limit,
+            args.url,
+            args.order,
+            args.chunk_size,
+            columns,
+            compression,
+        )
+
+    # Calculate and display total time.
+    end_time = time.time()
+    total_time = end_time - start_time
+    if args.sync:
+        print(f"Appended {rows:,} new rows to: {args.output}")
+    else:
+        print(f"Data saved to: {args.output} ({rows:,} rows)")
+    print(f"Total time to download and save data from API: {total_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+# Import libraries.
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from tqdm import tqdm
+
+# Define the default output file and size.
+file_name = "synthetic_nypd_arrests.csv"
+rows = 1000000
+# Define how many rows are generated and written at a time.
+batch_rows = 100000
+# Define the date range of the generated arrests.
+first_date = "2006-01-01"
+last_date = "2024-12-31"
+
+# Define the columns of the NYPD arrests export (dataset 8h9b-rp9u), in export order.
+columns = [
+    "arrest_key",
+    "arrest_date",
+    "pd_cd",
+    "pd_desc",
+    "ky_cd",
+    "ofns_desc",
+    "law_code",
+    "law_cat_cd",
+    "arrest_boro",
+    "arrest_precinct",
+    "jurisdiction_code",
+    "age_group",
+    "perp_sex",
+    "perp_race",
+    "x_coord_cd",
+    "y_coord_cd",
+    "latitude",
+    "longitude",
+    "lon_lat",
+]
+
+# Define the offenses: (pd_cd, pd_desc, ky_cd, ofns_desc, law_code, law_cat_cd, weight).
+offenses = [
+    (101, "ASSAULT 3", 344, "ASSAULT 3 & RELATED OFFENSES", "PL 1200001", "M", 14),
+    (109, "ASSAULT 2,1,UNCLASSIFIED", 106, "FELONY ASSAULT", "PL 1200502", "F", 6),
+    (
+        333,
+        "LARCENY,PETIT FROM STORE-SHOPL",
+        341,
+        "PETIT LARCENY",
+        "PL 1552500",
+        "M",
+        10,
+    ),
+    (439, "LARCENY,GRAND FROM OPEN AREAS", 109, "GRAND LARCENY", "PL 1553000", "F", 3),
+    (
+        511,
+        "CONTROLLED SUBSTANCE, POSSESSI",
+        235,
+        "DANGEROUS DRUGS",
+        "PL 2200300",
+        "M",
+        16,
+    ),
+    (
+        567,
+        "MARIJUANA, POSSESSION 4 & 5",
+        678,
+        "MISCELLANEOUS PENAL LAW",
+        "PL 2211000",
+        "M",
+        7,
+    ),
+    (397, "ROBBERY,OPEN AREA UNCLASSIFIED", 105, "ROBBERY", "PL 1600500", "F", 4),
+    (223, "BURGLARY,RESIDENCE,DAY", 107, "BURGLARY", "PL 1402500", "F", 3),
+    (792, "WEAPONS POSSESSION 1 & 2", 118, "DANGEROUS WEAPONS", "PL 2650300", "F", 4),
+    (
+        905,
+        "INTOXICATED DRIVING,ALCOHOL",
+        347,
+        "INTOXICATED & IMPAIRED DRIVING",
+        "VTL11920U4",
+        "M",
+        5,
+    ),
+    (
+        478,
+        "THEFT OF SERVICES, UNCLASSIFIED",
+        343,
+        "OTHER OFFENSES RELATED TO THEFT",
+        "PL 1651500",
+        "M",
+        6,
+    ),
+    (
+        922,
+        "TRAFFIC,UNCLASSIFIED MISDEMEAN",
+        348,
+        "VEHICLE AND TRAFFIC LAWS",
+        "VTL0511001",
+        "M",
+        7,
+    ),
+    (
+        259,
+        "CRIMINAL MISCHIEF,UNCLASSIFIED 4",
+        351,
+        "CRIMINAL MISCHIEF & RELATED OF",
+        "PL 1450000",
+        "M",
+        3,
+    ),
+    (681, "CHILD, ENDANGERING WELFARE", 233, "SEX CRIMES", "PL 2601000", "M", 1),
+    (739, "FRAUD,UNCLASSIFIED-FELONY", 112, "THEFT-FRAUD", "PL 1903200", "F", 2),
+    (762, "CRIMINAL TRESPASS 3", 352, "CRIMINAL TRESPASS", "PL 1401000", "M", 4),
+    (
+        779,
+        "PUBLIC ADMINISTRATION,UNCLASSI",
+        359,
+        "OFFENSES AGAINST PUBLIC ADMINI",
+        "PL 1950500",
+        "M",
+        3,
+    ),
+    (
+        969,
+        "TRAFFIC,UNCLASSIFIED INFRACTION",
+        881,
+        "OTHER TRAFFIC INFRACTION",
+        "VTL0509001",
+        "I",
+        1,
+    ),
+    (844, "FORGERY,ETC.,UNCLASSIFIED-FELO", 113, "FORGERY", "PL 1702500", "F", 1),
+]
+
+# Define the boroughs: (code, weight, precincts, latitude range, longitude range, x range, y range).
+boroughs = [
+    (
+        "B",
+        24,
+        (40, 52),
+        (40.80, 40.91),
+        (-73.93, -73.78),
+        (1005000, 1045000),
+        (230000, 270000),
+    ),
+    (
+        "K",
+        29,
+        (60, 94),
+        (40.57, 40.74),
+        (-74.04, -73.86),
+        (975000, 1030000),
+        (155000, 210000),
+    ),
+    (
+        "M",
+        25,
+        (1, 34),
+        (40.70, 40.87),
+        (-74.02, -73.91),
+        (980000, 1010000),
+        (195000, 255000),
+    ),
+    (
+        "Q",
+        18,
+        (100, 115),
+        (40.54, 40.80),
+        (-73.96, -73.70),
+        (1000000, 1065000),
+        (145000, 230000),
+    ),
+    (
+        "S",
+        4,
+        (120, 123),
+        (40.50, 40.65),
+        (-74.25, -74.05),
+        (915000, 975000),
+        (120000, 175000),
+    ),
+]
+
+# Define the demographic categories and their weights.
+age_groups = (["<18", "18-24", "25-44", "45-64", "65+"], [5, 24, 52, 18, 1])
+sexes = (["M", "F"], [83, 17])
+races = (
+    [
+        "BLACK",
+        "WHITE HISPANIC",
+        "WHITE",
+        "BLACK HISPANIC",
+        "ASIAN / PACIFIC ISLANDER",
+        "UNKNOWN",
+        "AMERICAN INDIAN/ALASKAN NATIVE",
+    ],
+    [47, 26, 11, 9, 5, 1.5, 0.5],
+)
+
+
+def _weighted_choice(
+    rng: np.random.Generator, values: list, weights: list, size: int
+) -> np.ndarray:
+    """Draw ``size`` items from ``values`` with the given relative weights."""
+    probabilities = np.asarray(weights, dtype=float)
+    return rng.choice(len(values), size=size, p=probabilities / probabilities.sum())
+
+
+def generate_batch(
+    rng: np.random.Generator, first_key: int, size: int, missing_rate: float = 0.002
+) -> pd.DataFrame:
+    """Generate one batch of NYPD-shaped arrest rows.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        Random number generator.
+    first_key : int
+        ``arrest_key`` of the first row; keys increase by one per row.
+    size : int
+        Number of rows to generate.
+    missing_rate : float
+        Fraction of rows with missing coordinates.
+
+    Returns
+    -------
+    pd.DataFrame
+        Rows with the columns of the real export, formatted as strings the way
+        the API returns them.
+    """
+    start = np.datetime64(first_date)
+    days = (np.datetime64(last_date) - start).astype(int) + 1
+    dates = start + rng.integers(0, days, size).astype("timedelta64[D]")
+
+    offense = np.array(offenses, dtype=object)[
+        _weighted_choice(rng, offenses, [o[-1] for o in offenses], size)
+    ]
+    borough_index = _weighted_choice(rng, boroughs, [b[1] for b in boroughs], size)
+
+    latitude = np.empty(size)
+    longitude = np.empty(size)
+    x_coord = np.empty(size, dtype=np.int64)
+    y_coord = np.empty(size, dtype=np.int64)
+    precinct = np.empty(size, dtype=np.int64)
+    for index, (_, _, precincts, lat, lon, x, y) in enumerate(boroughs):
+        mask = borough_index == index
+        count = int(mask.sum())
+        latitude[mask] = rng.uniform(*lat, count)
+        longitude[mask] = rng.uniform(*lon, count)
+        x_coord[mask] = rng.integers(*x, count)
+        y_coord[mask] = rng.integers(*y, count)
+        precinct[mask] = rng.integers(precincts[0], precincts[1] + 1, count)
+
+    batch = pd.DataFrame(
+        {
+            "arrest_key": np.arange(first_key, first_key + size),
+            "arrest_date": pd.Series(np.datetime_as_string(dates)) + "T00:00:00.000",
+            "pd_cd": offense[:, 0],
+            "pd_desc": offense[:, 1],
+            "ky_cd": offense[:, 2],
+            "ofns_desc": offense[:, 3],
+            "law_code": offense[:, 4],
+            "law_cat_cd": offense[:, 5],
+            "arrest_boro": np.array([b[0] for b in boroughs])[borough_index],
+            "arrest_precinct": precinct,
+            "jurisdiction_code": rng.choice([0, 0, 0, 0, 0, 0, 0, 0, 1, 2], size),
+            "age_group": np.array(age_groups[0])[
+                _weighted_choice(rng, *age_groups, size)
+            ],
+            "perp_sex": np.array(sexes[0])[_weighted_choice(rng, *sexes, size)],
+            "perp_race": np.array(races[0])[_weighted_choice(rng, *races, size)],
+            "x_coord_cd": x_coord.astype(str),
+            "y_coord_cd": y_coord.astype(str),
+            "latitude": latitude.round(6).astype(str),
+            "longitude": longitude.round(6).astype(str),
+        }
+    )
+    batch["lon_lat"] = "POINT (" + batch["longitude"] + " " + batch["latitude"] + ")"
+
+    # Some arrests have no location in the real export.
+    missing = rng.random(size) < missing_rate
+    batch.loc[
+        missing, ["x_coord_cd", "y_coord_cd", "latitude", "longitude", "lon_lat"]
+    ] = ""
+    return batch[columns]
+
+
+def generate_csv(
+    file_path: str, total_rows: int, seed: int = 42, missing_rate: float = 0.002
+) -> None:
+    """Write a synthetic NYPD arrests CSV of any size.
+
+    Parameters
+    ----------
+    file_path : str
+        Destination CSV file.
+    total_rows : int
+        Number of data rows to write.
+    seed : int
+        Random seed, so the same arguments always produce the same file.
+    missing_rate : float
+        Fraction of rows with missing coordinates.
+
+    Returns
+    -------
+    None
+        The file is written to disk.
+
+    Purpose
+    -------
+    Produces files with the columns, value formats and rough distributions of
+    the real export (every field quoted, ISO timestamps, borough codes,
+    offense and demographic categories, coordinates inside the borough), so
+    the downloader and the dashboard can be tested and benchmarked offline.
+    Rows are generated in batches, so memory does not grow with ``total_rows``.
+    """
+    rng = np.random.default_rng(seed)
+    with open(file_path, "w", newline="") as f, tqdm(
+        total=total_rows, unit=" rows", unit_scale=True, desc="Generating"
+    ) as pbar:
+        for first_key in range(0, total_rows, batch_rows):
+            size = min(batch_rows, total_rows - first_key)
+            generate_batch(rng, first_key, size, missing_rate).to_csv(
+                f, header=first_key == 0, index=False, quoting=1, lineterminator="\n"
+            )
+            pbar.update(size)
+
+
+def main() -> None:
+    """Generate a synthetic NYPD arrests CSV for offline testing."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--output", default=file_name, help="Output CSV file.")
+    parser.add_argument("--rows", type=int, default=rows, help="Rows to generate.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    parser.add_argument(
+        "--missing-rate",
+        type=float,
+        default=0.002,
+        help="Fraction of rows without coordinates.",
+    )
+    args = parser.parse_args()
+
+    start_time = time.time()
+    generate_csv(args.output, args.rows, args.seed, args.missing_rate)
+    print(f"Data saved to: {args.output} ({args.rows:,} rows)")
+    print(f"Total time: {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+# Import libraries.
+import argparse
+import mmap
+import re
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+# Define the default port the stand-in server listens on.
+port = 8765
+# Define the size of each block written to the socket.
+block_size = 64 * 1024
+# Define the number of rows returned when a request has no $limit (same as Socrata).
+default_limit = 1000
+
+# Define the SoQL comparison operators supported in $where.
+where_pattern = re.compile(
+    r"^\s*([\w:]+)\s*(>=|<=|!=|=|<|>)\s*('(?:[^']|'')*'|-?[\d.]+)\s*$"
+)
+# Define the SoQL functions supported in $select, $group and $order.
+function_pattern = re.compile(r"^\s*(\w+)\s*\(\s*([\w:*]+)\s*\)\s*$", re.IGNORECASE)
+
+
+class SoQLError(ValueError):
+    """Raised for queries outside the supported subset of SoQL."""
+
+
+def index_csv_lines(file_path: str) -> Tuple[mmap.mmap, np.ndarray]:
+    """Memory-map a CSV file and find where each line starts.
+
+    Parameters
+    ----------
+    file_path : str
+        CSV file served by the stand-in.
+
+    Returns
+    -------
+    Tuple[mmap.mmap, np.ndarray]
+        The mapped file, and the byte offset of every line start plus the
+        file size, so line ``i`` is ``data[offsets[i]:offsets[i + 1]]``.
+    """
+    with open(file_path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n"))
+    offsets = np.concatenate(([0], newlines + 1))
+    if offsets[-1] != len(data):
+        offsets = np.append(offsets, len(data))
+    return data, offsets
+
+
+def split_list(clause: str) -> List[str]:
+    """Split a comma-separated SoQL clause, ignoring commas inside parentheses."""
+    items, depth, current = [], 0, ""
+    for char in clause:
+        if char == "," and depth == 0:
+            items.append(current.strip())
+            current = ""
+            continue
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        current += char
+    if current.strip():
+        items.append(current.strip())
+    return items
+
+
+def evaluate_expression(df: pd.DataFrame, expression: str) -> pd.Series:
+    """Evaluate a column name or a supported SoQL function on a frame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Rows as strings, with ``""`` for missing values.
+    expression : str
+        A column name, ``:id``, or ``date_extract_y``/``date_extract_m``/
+        ``date_extract_dow`` of a floating timestamp column.
+
+    Returns
+    -------
+    pd.Series
+        The evaluated values, as strings.
+    """
+    expression = expression.strip()
+    if expression == ":id":
+        return pd.Series(df.index.astype(str), index=df.index)
+    if expression in df.columns:
+        return df[expression]
+
+    match = function_pattern.match(expression)
+    if match is None or match.group(2) not in df.columns:
+        raise SoQLError(f"Unsupported expression: {expression}")
+    function, column = match.group(1).lower(), match.group(2)
+    dates = pd.to_datetime(df[column], errors="coerce", format="ISO8601")
+    if function == "date_extract_y":
+        values = dates.dt.year
+    elif function == "date_extract_m":
+        values = dates.dt.month
+    elif function == "date_extract_dow":
+        # Socrata counts from Sunday (0); pandas counts from Monday (0).
+        values = (dates.dt.dayofweek + 1) % 7
+    else:
+        raise SoQLError(f"Unsupported function: {function}")
+    return values.astype("Int64").astype(str).replace("<NA>", "")
+
+
+def _sort_key(values: pd.Series) -> pd.Series:
+    """Sort numbers numerically and everything else as text."""
+    numbers = pd.to_numeric(values.replace("", np.nan), errors="coerce")
+    if numbers.notna().sum() == (values != "").sum():
+        return numbers
+    return values
+
+
+def apply_where(df: pd.DataFrame, clause: str) -> pd.DataFrame:
+    """Filter rows with a ``$where`` clause of comparisons joined by AND.
+
+    Quoted literals are compared as text (ISO timestamps sort correctly as
+    text); unquoted literals are compared as numbers.
+    """
+    mask = pd.Series(True, index=df.index)
+    for condition in re.split(r"\s+AND\s+", clause, flags=re.IGNORECASE):
+        match = where_pattern.match(condition)
+        if match is None:
+            raise SoQLError(f"Unsupported $where condition: {condition}")
+        column, operator, literal = match.groups()
+        values = evaluate_expression(df, column)
+        if literal.startswith("'"):
+            literal = literal[1:-1].replace("''", "'")
+            present = values != ""
+        else:
+            values = pd.to_numeric(values.replace("", np.nan), errors="coerce")
+            literal = float(literal)
+            present = values.notna()
+        comparisons = {
+            "=": values == literal,
+            "!=": values != literal,
+            "<": values < literal,
+            "<=": values <= literal,
+            ">": values > literal,
+            ">=": values >= literal,
+        }
+        # Missing values never match, as in SQL.
+        mask &= comparisons[operator] & present
+    return df[mask]
+
+
+def apply_order(df: pd.DataFrame, clause: str, aliases: Dict[str, str]) -> pd.DataFrame:
+    """Sort rows by an ``$order`` clause such as ``arrest_date DESC, :id``."""
+    keys, ascending = [], []
+    for term in split_list(clause):
+        parts = term.rsplit(None, 1)
+        descending = len(parts) == 2 and parts[1].upper() == "DESC"
+        if len(parts) == 2 and parts[1].upper() in ("ASC", "DESC"):
+            term = parts[0]
+        keys.append(_sort_key(evaluate_expression(df, aliases.get(term, term))))
+        ascending.append(not descending)
+    order_frame = pd.DataFrame({f"key{i}": key for i, key in enumerate(keys)})
+    order_frame["position"] = np.arange(len(df))
+    order_frame = order_frame.sort_values(
+        list(order_frame.columns), ascending=ascending + [True], kind="stable"
+    )
+    return df.iloc[order_frame["position"].to_numpy()]
+
+
+def run_query(frame: pd.DataFrame, params: Dict[str, str]) -> pd.DataFrame:
+    """Run a SoQL query against the served rows.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        Every served row as strings; the index is the row id (``:id``).
+    params : Dict[str, str]
+        Query parameters: ``$where``, ``$select``, ``$group``, ``$order``,
+        ``$offset`` and ``$limit``.
+
+    Returns
+    -------
+    pd.DataFrame
+        The result rows, in output column order.
+
+    Purpose
+    -------
+    Implements the subset of SoQL used by ``download_dataset.py``: comparisons
+    joined by AND in ``$where``; columns, ``expr AS alias``, ``count(*)`` and
+    the ``date_extract_*`` functions in ``$select``; grouping with ``count(*)``;
+    sorting; and paging.
+    """
+    df = frame
+    if "$where" in params:
+        df = apply_where(df, params["$where"])
+
+    select: List[Tuple[str, str]] = []
+    for item in split_list(params.get("$select", "")):
+        parts = re.split(r"\s+AS\s+", item, flags=re.IGNORECASE)
+        select.append((parts[0].strip(), parts[-1].strip()))
+    aliases = {alias: expression for expression, alias in select}
+
+    if "$group" in params or any(expr.lower() == "count(*)" for expr, _ in select):
+        group = [aliases.get(g, g) for g in split_list(params.get("$group", ""))]
+        keys = pd.DataFrame(
+            {f"g{i}": evaluate_expression(df, expr) for i, expr in enumerate(group)}
+        )
+        if group:
+            sizes = keys.groupby(list(keys.columns), sort=False).size()
+            grouped = sizes.reset_index(name="count")
+        else:
+            grouped = pd.DataFrame({"count": [len(df)]})
+        result = pd.DataFrame(index=grouped.index)
+        for expression, alias in select:
+            if expression.lower() == "count(*)":
+                result[alias] = grouped["count"].astype(str)
+            elif expression in group:
+                result[alias] = grouped[f"g{group.index(expression)}"]
+            else:
+                raise SoQLError(f"{expression} must appear in $group")
+        if "$order" in params:
+            result = apply_order(result, params["$order"], {})
+    else:
+        if "$order" in params:
+            df = apply_order(df, params["$order"], aliases)
+        if select:
+            result = pd.DataFrame(
+                {alias: evaluate_expression(df, expr) for expr, alias in select}
+            )
+        else:
+            result = df
+
+    offset = int(params.get("$offset", 0))
+    row_limit = int(params.get("$limit", default_limit))
+    return result.iloc[offset : offset + row_limit]
+
+
+class SocrataStandInHandler(BaseHTTPRequestHandler):
+    """Serve a CSV file like the Socrata ``/resource/<id>.csv`` endpoint.
+
+    Requests that only page through the file in its own order (``$limit``,
+    ``$offset`` and ``$order=:id``) are served straight from the memory-mapped
+    file. Anything else is answered by ``run_query`` from a string frame that
+    is loaded on first use. Every response is throttled to
+    ``server.bytes_per_second`` to emulate a slow single stream.
+    """
+
+    def do_GET(self) -> None:
+        params = {
+            key: values[-1]
+            for key, values in parse_qs(urlparse(self.path).query).items()
+        }
+        try:
+            if (
+                set(params) <= {"$limit", "$offset", "$order"}
+                and params.get("$order", ":id") == ":id"
+            ):
+                body = self._raw_lines(params)
+            else:
+                result = run_query(self.server.frame(), params)
+                body = result.to_csv(index=False, quoting=1, lineterminator="\n")
+                body = [body.encode()]
+        except (SoQLError, ValueError) as e:
+            self.send_error(400, str(e))
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv; charset=UTF-8")
+        self.end_headers()
+        self._write_throttled(body)
+
+    def _raw_lines(self, params: Dict[str, str]) -> List[memoryview]:
+        """Return the header and the requested rows as slices of the file."""
+        data, offsets = self.server.data, self.server.offsets
+        row_count = len(offsets) - 2
+        first = min(int(params.get("$offset", 0)), row_count) + 1
+        last = min(first + int(params.get("$limit", default_limit)), row_count + 1)
+        view = memoryview(data)
+        return [view[offsets[0] : offsets[1]], view[offsets[first] : offsets[last]]]
+
+    def _write_throttled(self, blocks: List[bytes]) -> None:
+        """Write blocks, sleeping to honour the rate limit."""
+        rate = self.server.bytes_per_second
+        start = time.perf_counter()
+        sent = 0
+        for block in blocks:
+            for position in range(0, len(block), block_size):
+                piece = block[position : position + block_size]
+                self.wfile.write(piece)
+                sent += len(piece)
+                if rate:
+                    ahead = sent / rate - (time.perf_counter() - start)
+                    if ahead > 0:
+                        time.sleep(ahead)
+
+    def log_message(self, format: str, *args) -> None:
+        # Keep benchmark output readable.
+        pass
+
+
+class SocrataStandInServer(ThreadingHTTPServer):
+    """HTTP server holding the served file for ``SocrataStandInHandler``."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        file_path: str,
+        bytes_per_second: Optional[float],
+    ) -> None:
+        super().__init__(address, SocrataStandInHandler)
+        self.file_path = file_path
+        self.bytes_per_second = bytes_per_second
+        self.data, self.offsets = index_csv_lines(file_path)
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_lock = threading.Lock()
+
+    def frame(self) -> pd.DataFrame:
+        """Return every row as strings, loading the file on first use."""
+        with self._frame_lock:
+            if self._frame is None:
+                self._frame = pd.read_csv(
+                    self.file_path, dtype=str, keep_default_na=False
+                )
+            return self._frame
+
+
+def start_server(
+    file_path: str, server_port: int = 0, bytes_per_second: Optional[float] = None
+) -> SocrataStandInServer:
+    """Start the stand-in server on a background thread.
+
+    Parameters
+    ----------
+    file_path : str
+        CSV file to serve.
+    server_port : int
+        Port to listen on. ``0`` picks a free port.
+    bytes_per_second : Optional[float]
+        Per-connection bandwidth limit. ``None`` serves as fast as possible.
+
+    Returns
+    -------
+    SocrataStandInServer
+        The running server. Its URL is ``http://127.0.0.1:<server_port>/``;
+        call ``shutdown()`` to stop it.
+    """
+    server = SocrataStandInServer(
+        ("127.0.0.1", server_port), file_path, bytes_per_second
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    """Run a local stand-in for the NYC Open Data arrests endpoint."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "file", help="CSV file to serve, e.g. from generate_synthetic_data.py."
+    )
+    parser.add_argument("--port", type=int, default=port, help="Port to listen on.")
+    parser.add_argument(
+        "--bytes-per-second",
+        type=float,
+        default=None,
+        help="Per-connection bandwidth limit.",
+    )
+    args = parser.parse_args()
+
+    server = start_server(args.file, args.port, args.bytes_per_second)
+    print(
+        f"Serving {args.file} at http://127.0.0.1:{server.server_address[1]}/resource/8h9b-rp9u.csv"
+    )
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,11 @@
 # Import libraries.
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
 import numpy as np
 import pandas as pd
 import plotly.express as px
@@ -8,228 +15,2277 @@ import warnings
 
 from datetime import datetime, timedelta
 from plotly.subplots import make_subplots
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Dict, Iterator, List, Tuple, Optional, Any, Union
+
+from download_dataset import load_manifest, manifest_matches
+from nypd_sketches import ColumnSketches, sketch_partitions
+from nypd_schema import (
+    column_mapping,
+    compression_suffixes,
+    arrow_column_types,
+    borough_bounds,
+    csv_column_types,
+    dashboard_columns,
+    date_format,
+    detect_compression,
+    partition_column,
+    summary_count_column,
+    summary_groups,
+    summary_rollup_column,
+    summary_rollups,
+    validation_rules,
+)
+
+
+# Suppress warnings for cleaner output
+warnings.filterwarnings("ignore")
+
+
+def standardize_text_column(series: pd.Series, upper: bool = False) -> pd.Series:
+    """Fill missing values with "Unknown" and optionally upper-case a text column.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Text column, either object/string or categorical.
+    upper : bool
+        If True, upper-case every value.
+
+    Returns
+    -------
+    pd.Series
+        Standardized column. Categorical columns stay categorical.
+
+    Purpose
+    -------
+    Categorical columns (as read from the Parquet dataset) are standardized by
+    working on their categories instead of on every row, and "Unknown" is added
+    as a category so that filling missing values does not fail.
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.fillna("Unknown").astype(str)
+        return series.str.upper() if upper else series
+
+    categories = series.cat.categories.astype(str)
+    if upper:
+        categories = categories.str.upper()
+    # Missing values have code -1, which picks the trailing "Unknown" entry.
+    lookup = categories.append(pd.Index(["Unknown"]))
+    uniques = lookup.unique()
+    codes = uniques.get_indexer(lookup)[series.cat.codes.to_numpy()]
+    standardized = pd.Categorical.from_codes(codes, uniques).remove_unused_categories()
+    return pd.Series(standardized, index=series.index, name=series.name)
+
+
+def rollup_rows(df: pd.DataFrame, column: Optional[str] = None) -> pd.DataFrame:
+    """Return the rows of the summary table that count arrests by a column.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Row-level arrests, or the summary table.
+    column : Optional[str]
+        Dashboard column to count by. ``None`` accepts any rollup.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows of the first rollup in ``summary_rollups`` that groups by
+        ``column``, so each arrest is counted once. Frames without a
+        ``ROLLUP`` column are returned as they are.
+    """
+    if rollup_column not in df.columns:
+        return df
+    for name, keys in summary_rollups.items():
+        columns = [summary_column_names[key] for key in keys]
+        columns += [
+            derived
+            for derived, source in summary_derived_columns.items()
+            if source in columns
+        ]
+        if column is None or column in columns:
+            return df[df[rollup_column] == name]
+    return df.iloc[:0]
+
+
+def count_arrests(df: pd.DataFrame) -> int:
+    """Count the arrests represented by a frame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Row-level arrests, or the summary table where each row carries an
+        arrest count in the ``ARRESTS`` column.
+
+    Returns
+    -------
+    int
+        Number of arrests.
+    """
+    if count_column in df.columns:
+        return int(rollup_rows(df)[count_column].sum())
+    return len(df)
+
+
+def arrest_counts(df: pd.DataFrame, column: str) -> pd.Series:
+    """Count arrests per value of a column, largest first.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Row-level arrests, or the summary table.
+    column : str
+        Column to group by.
+
+    Returns
+    -------
+    pd.Series
+        Number of arrests indexed by the values of ``column``, like ``value_counts()``.
+
+    Purpose
+    -------
+    Lets the analysis tabs work on both row-level data and the summary table,
+    where every row stands for ``ARRESTS`` arrests.
+    """
+    if count_column in df.columns:
+        rows = rollup_rows(df, column)
+        counts = rows.groupby(column, observed=True)[count_column].sum()
+        return counts[counts > 0].sort_values(ascending=False).rename("count")
+    # Categorical columns also count their unused categories
+    counts = df[column].value_counts()
+    return counts[counts > 0]
+
+
+def derive_date_columns(
+    dates: pd.Series, columns: Optional[List[str]] = None
+) -> Dict[str, Union[np.ndarray, pd.Categorical]]:
+    """Parse arrest dates and derive their date parts, once per distinct day.
+
+    Parameters
+    ----------
+    dates : pd.Series
+        Arrest dates as text (plain or categorical) or already parsed datetimes.
+    columns : Optional[List[str]]
+        Columns to return. ``None`` returns all of them.
+
+    Returns
+    -------
+    Dict[str, Union[np.ndarray, pd.Categorical]]
+        ``ARREST_DATE`` (missing or unparseable dates are NaT), ``YEAR``,
+        ``MONTH``, ``DAY_OF_WEEK`` (categorical) and ``QUARTER``, one value per
+        row. Rows without a valid date get 2024, 1, "Unknown" and 1.
+
+    Purpose
+    -------
+    Six million arrests fall on a few thousand days. The column is reduced to
+    its distinct values and integer codes (the categorical codes when it was
+    read as a category), each distinct value is parsed with the API's
+    ``date_format`` and only values in another format fall back to format
+    inference. The date parts are computed on the same per-day table and
+    mapped back to the rows by code.
+    """
+    if isinstance(dates.dtype, pd.CategoricalDtype):
+        codes, uniques = dates.cat.codes.to_numpy(), dates.cat.categories
+    else:
+        codes, uniques = pd.factorize(dates)
+
+    if pd.api.types.is_datetime64_any_dtype(uniques):
+        days = pd.DatetimeIndex(uniques)
+    else:
+        values = pd.Series(uniques)
+        parsed = pd.to_datetime(values, format=date_format, errors="coerce")
+        # Only values in another format go through format inference
+        outliers = parsed.isna() & values.notna()
+        if outliers.any():
+            parsed[outliers] = pd.to_datetime(
+                values[outliers], format="mixed", errors="coerce"
+            )
+        days = pd.DatetimeIndex(parsed)
+    # Missing values have code -1, which picks the trailing NaT entry
+    days = days.append(pd.DatetimeIndex([pd.NaT]))
+
+    lookup = {
+        "ARREST_DATE": days.to_numpy(),
+        "YEAR": days.year.fillna(2024).astype(date_part_types["YEAR"]).to_numpy(),
+        "MONTH": days.month.fillna(1).astype(date_part_types["MONTH"]).to_numpy(),
+        "DAY_OF_WEEK": pd.Categorical(
+            days.day_name().fillna("Unknown"), categories=day_names + ["Unknown"]
+        ),
+        "QUARTER": days.quarter.fillna(1).astype(date_part_types["QUARTER"]).to_numpy(),
+    }
+    return {
+        name: values.take(codes)
+        for name, values in lookup.items()
+        if columns is None or name in columns
+    }
+
+
+@pd.api.extensions.register_dataframe_accessor("date_parts")
+class DatePartsAccessor:
+    """Date parts of ``ARREST_DATE``, built on first use and cached.
+
+    ``df.date_parts["YEAR"]`` returns the ``YEAR`` column of ``df`` if it has
+    one (the summary table does), and otherwise derives it from
+    ``ARREST_DATE`` with ``derive_date_columns``. pandas keeps the accessor for
+    the lifetime of the frame, so each part is derived at most once per frame.
+    The loader therefore only stores ``ARREST_DATE``: sessions that never need
+    a part never pay for it, and the parts of a sample are derived for the
+    sampled rows only.
+    """
+
+    names = ["YEAR", "MONTH", "DAY_OF_WEEK", "QUARTER"]
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+        self._cache: Dict[str, pd.Series] = {}
+
+    def __getitem__(self, name: str) -> pd.Series:
+        if name in self._df.columns:
+            return self._df[name]
+        if name not in self._cache:
+            if "ARREST_DATE" in self._df.columns:
+                values = derive_date_columns(self._df["ARREST_DATE"], [name])[name]
+            else:
+                # Without dates every row gets the dummy value
+                values = derive_date_columns(
+                    pd.Series(pd.NaT, index=self._df.index), [name]
+                )[name]
+            self._cache[name] = pd.Series(values, index=self._df.index, name=name)
+        return self._cache[name]
+
+    def with_columns(
+        self, names: Optional[List[str]] = None, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Return the given date parts (default: all) with other columns of the frame.
+
+        ``columns`` selects the other columns to keep (default: all). Only the
+        derived parts and the kept columns are put together, so a caller that
+        needs a few columns never copies the rest of the frame; keeping all of
+        them copies the frame unless pandas runs with copy-on-write.
+        """
+        names = names or self.names
+        missing = [name for name in names if name not in self._df.columns]
+        frame = self._df
+        if columns is not None:
+            frame = frame[[col for col in frame.columns if col in columns + names]]
+        if not missing:
+            return frame
+        parts = pd.DataFrame({name: self[name] for name in missing})
+        return pd.concat([frame, parts], axis=1)
+
+
+def check_column(
+    series: pd.Series, rule: Dict[str, Any], stats: Dict[str, Any]
+) -> Tuple[pd.Series, List[Dict[str, Any]]]:
+    """Check one column against its rule from ``validation_rules``.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column to check.
+    rule : Dict[str, Any]
+        The column's entry in ``validation_rules``.
+    stats : Dict[str, Any]
+        The column's statistics from a matching download manifest, if any.
+
+    Returns
+    -------
+    Tuple[pd.Series, List[Dict[str, Any]]]
+        The column, repaired if it failed a check that can be repaired (the
+        same object otherwise), and one report record per check.
+    """
+    checks = []
+    if rule["kind"] == "category":
+        is_categorical = isinstance(series.dtype, pd.CategoricalDtype)
+        # Columns the manifest shows complete need no scan for missing values
+        missing = 0 if stats.get("nulls") == 0 else int(series.isna().sum())
+        wrong_type = 0 if is_categorical else len(series)
+        checks.append(("dtype", "categorical", wrong_type, "converted to category"))
+        checks.append(("missing", "no missing values", missing, 'filled "Unknown"'))
+        if missing or not is_categorical:
+            series = standardize_text_column(series)
+            if not is_categorical:
+                series = series.astype("category")
+        if "values" in rule:
+            # Count per category instead of comparing every row
+            counts = series.value_counts()
+            allowed = set(rule["values"]) | {"Unknown"}
+            unexpected = int(counts[~counts.index.isin(allowed)].sum())
+            values = f"one of {', '.join(rule['values'])}"
+            checks.append(("values", values, unexpected, "kept"))
+    else:
+        if not pd.api.types.is_numeric_dtype(series):
+            numbers = pd.to_numeric(series, errors="coerce", downcast="float")
+            invalid = int(numbers.isna().sum() - series.isna().sum())
+            checks.append(("dtype", "numeric", invalid, "set to missing"))
+            series = numbers
+        else:
+            checks.append(("dtype", "numeric", 0, "set to missing"))
+        if "range" in rule:
+            low, high = rule["range"]
+            outside = int(((series < low) | (series > high)).sum())
+            checks.append(
+                ("range", f"between {low} and {high}", outside, "kept, not mapped")
+            )
+
+    records = [
+        {
+            "column": series.name,
+            "check": check,
+            "rule": text,
+            "failed_rows": failed,
+            "action": action,
+        }
+        for check, text, failed, action in checks
+    ]
+    return series, records
+
+
+def merge_validation_reports(
+    first: List[Dict[str, Any]], second: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Add up the validation reports of two parts of the same dataset.
+
+    Parameters
+    ----------
+    first : List[Dict[str, Any]]
+        Report of the first part, from ``validate_and_clean_data``.
+    second : List[Dict[str, Any]]
+        Report of the second part.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        One record per check of either report, with the failing rows summed.
+    """
+    merged = {(r["column"], r["check"]): dict(r) for r in first}
+    for record in second:
+        key = (record["column"], record["check"])
+        if key in merged:
+            merged[key]["failed_rows"] += record["failed_rows"]
+        else:
+            merged[key] = dict(record)
+    return list(merged.values())
+
+
+def validate_and_clean_data(
+    df: pd.DataFrame, column_stats: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+    """Validate the dataset against ``validation_rules`` and repair what fails.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataset with the dashboard's column names that needs validation.
+    column_stats : Optional[Dict[str, Dict[str, Any]]]
+        Per-column statistics of the raw file from a download manifest that
+        matches it. Columns the statistics show have no missing values are
+        not scanned for them.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, List[Dict[str, Any]]]
+        The validated dataset and its validation report: one record per check
+        with the column, the check, its rule, the number of failing rows and
+        the action taken on them.
+
+    Purpose
+    -------
+    Every check is vectorized, and only the columns failing a check that can
+    be repaired are replaced: text columns become categorical, missing
+    categories are filled with "Unknown" and coordinates that are not
+    numbers become missing. Unexpected codes and coordinates outside the
+    city are reported but kept. ``df`` itself is neither copied nor modified.
+    """
+    report = []
+    clean_df = df
+    try:
+        # Statistics recorded by the downloader, under the dashboard's column names
+        known = {
+            column_mapping.get(raw_name, raw_name): stats
+            for raw_name, stats in (column_stats or {}).items()
+        }
+
+        for col, rule in validation_rules.items():
+            if col not in df.columns:
+                continue
+            column = df[col]
+            series, records = check_column(column, rule, known.get(col, {}))
+            report.extend(records)
+            if series is not column:
+                # Replace failing columns on a shallow copy; the others are shared
+                if clean_df is df:
+                    clean_df = df.copy(deep=False)
+                clean_df[col] = series
+
+    except Exception as e:
+        st.warning(f"Data validation warning: {str(e)}")
+    return clean_df, report
+
+
+def mappable_coordinates(
+    latitude: pd.Series, longitude: pd.Series, borough: Optional[pd.Series] = None
+) -> np.ndarray:
+    """Tell which arrests have coordinates worth plotting on the map.
+
+    Parameters
+    ----------
+    latitude : pd.Series
+        Latitude of each arrest.
+    longitude : pd.Series
+        Longitude of each arrest.
+    borough : Optional[pd.Series]
+        Borough code of each arrest. If given, the coordinates must also lie
+        in the box of that borough in ``borough_bounds``.
+
+    Returns
+    -------
+    np.ndarray
+        One bool per arrest: True when both coordinates are present and
+        inside the city's bounding box from ``validation_rules``. Missing and
+        zero coordinates are never mappable. Unknown boroughs are only held
+        to the city's box.
+    """
+    lat = latitude.to_numpy(dtype=np.float64, na_value=np.nan)
+    lon = longitude.to_numpy(dtype=np.float64, na_value=np.nan)
+    lat_low, lat_high = validation_rules["latitude"]["range"]
+    lon_low, lon_high = validation_rules["longitude"]["range"]
+    # Comparisons with NaN are False, so missing coordinates drop out here
+    mask = (lat >= lat_low) & (lat <= lat_high) & (lon >= lon_low) & (lon <= lon_high)
+
+    if borough is not None:
+        # Look the box of each row up through the category codes; the extra
+        # last box, picked by code -1 (missing), is unbounded
+        borough = borough.astype("category")
+        unbounded = ((-np.inf, np.inf), (-np.inf, np.inf))
+        boxes = np.array(
+            [
+                borough_bounds.get(str(code).upper(), unbounded)
+                for code in borough.cat.categories
+            ]
+            + [unbounded]
+        )
+        codes = borough.cat.codes.to_numpy()
+        mask &= (lat >= boxes[codes, 0, 0]) & (lat <= boxes[codes, 0, 1])
+        mask &= (lon >= boxes[codes, 1, 0]) & (lon <= boxes[codes, 1, 1])
+    return mask
+
+
+def mappable_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the arrests of a frame that can be plotted on the map.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Arrests with latitude and longitude columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows whose ``mappable_column`` is set. Frames loaded without it
+        are checked with ``mappable_coordinates`` instead.
+    """
+    if mappable_column in df.columns:
+        return df[df[mappable_column].to_numpy(dtype=bool)]
+    borough = df["ARREST_BORO"] if "ARREST_BORO" in df.columns else None
+    return df[mappable_coordinates(df["latitude"], df["longitude"], borough)]
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Hash every row of the dataset's source columns to 64 bits.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Processed arrests, or a batch of them.
+
+    Returns
+    -------
+    np.ndarray
+        One ``uint64`` per row. Equal rows get equal hashes, whatever the
+        categories of each batch, as categorical values are hashed by value,
+        and whatever the CSV engine, as dates are hashed in milliseconds.
+        Derived columns are left out, as they follow from the source ones.
+    """
+    columns = [col for col in column_mapping.values() if col in df.columns]
+    source = df[columns]
+    # Arrow parses dates to milliseconds and pandas to microseconds
+    for col in columns:
+        if pd.api.types.is_datetime64_dtype(source[col]):
+            source[col] = source[col].dt.as_unit("ms")
+    return pd.util.hash_pandas_object(source, index=False).to_numpy()
+
+
+class RowHashIndex:
+    """Set of the row hashes seen so far, grown batch by batch.
+
+    The distinct hashes are kept in sorted ``uint64`` runs, 8 bytes per row.
+    ``add`` looks a batch up with a binary search per row in each run and
+    stores its new hashes as one more run. A run is merged into the one before
+    it while that one is at most ``merge_ratio`` times larger, so there are
+    only a few runs and each hash is copied a few times over a whole load,
+    where inserting into a single array rewrote it for every batch. Rows
+    loaded before are never hashed again. ``duplicates`` counts the rows that
+    repeated an earlier row.
+    """
+
+    merge_ratio = 8
+
+    def __init__(self) -> None:
+        self.runs: List[np.ndarray] = []
+        self.duplicates = 0
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        """Add a batch of row hashes; return a mask of the ones seen before."""
+        unique, first = np.unique(hashes, return_index=True)
+        known = np.zeros(len(unique), dtype=bool)
+        for run in self.runs:
+            positions = np.searchsorted(run, unique)
+            found = positions < len(run)
+            found[found] = run[positions[found]] == unique[found]
+            known |= found
+
+        # Repeats within the batch, and first occurrences of known hashes
+        seen = np.ones(len(hashes), dtype=bool)
+        seen[first[~known]] = False
+        run = unique[~known]
+        while self.runs and len(self.runs[-1]) <= self.merge_ratio * len(run):
+            # The stable sort merges the two sorted runs in one pass
+            run = np.sort(np.concatenate([self.runs.pop(), run]), kind="stable")
+        if len(run):
+            self.runs.append(run)
+        self.duplicates += int(seen.sum())
+        return seen
+
+
+def process_memory_mb() -> Optional[float]:
+    """Return the resident memory of this process in MB, if the OS reports it.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    Optional[float]
+        Resident set size from ``/proc/self/statm``, or None where that file
+        does not exist (macOS, Windows).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class LoadProfile:
+    """Duration, throughput and memory change of each stage of a load.
+
+    ``lap(stage, rows)`` closes a stage that started at the previous lap (or
+    at creation) and records its seconds, rows per second and the change in
+    process memory. Stages recorded more than once, e.g. once per batch of a
+    progressive load, are summed per stage. ``log`` writes every stage and a
+    summary, including the bytes read from disk, as one JSON object per line
+    to the ``nypd_dashboard.load`` logger, so load times can be compared
+    across deploys.
+    """
+
+    def __init__(self, source: str = "") -> None:
+        self.source = source
+        self.stages: List[Dict[str, Any]] = []
+        self.file_bytes = 0
+        self._start = self._last = time.perf_counter()
+        self._memory = process_memory_mb()
+
+    def lap(self, stage: str, rows: int, file_bytes: Optional[int] = None) -> None:
+        """Record the stage that ends now, with the number of rows it handled."""
+        now = time.perf_counter()
+        memory = process_memory_mb()
+        seconds = now - self._last
+        record = {
+            "stage": stage,
+            "seconds": seconds,
+            "rows": rows,
+            "memory_delta_mb": (
+                memory - self._memory
+                if memory is not None and self._memory is not None
+                else None
+            ),
+        }
+        if file_bytes is not None:
+            self.file_bytes += file_bytes
+        self.stages.append(record)
+        self._last, self._memory = now, memory
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(record["seconds"] for record in self.stages)
+
+    def stage_totals(self) -> pd.DataFrame:
+        """Return the laps summed per stage, in the order the stages first ran."""
+        stages = pd.DataFrame(self.stages)
+        totals = stages.groupby("stage", sort=False).agg(
+            seconds=("seconds", "sum"),
+            rows=("rows", "sum"),
+            memory_delta_mb=("memory_delta_mb", "sum"),
+        )
+        totals["rows_per_second"] = (totals["rows"] / totals["seconds"]).round()
+        return totals.reset_index()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return one display row per stage with its share of the load time."""
+        summary = self.stage_totals()
+        share = summary["seconds"] / self.total_seconds
+        summary["share"] = share.map("{:.0%}".format)
+        return summary[
+            ["stage", "seconds", "rows_per_second", "memory_delta_mb", "share"]
+        ].round({"seconds": 3, "memory_delta_mb": 1})
+
+    def log(self, rows: int, **fields: Any) -> None:
+        """Write the stages and a summary of a ``rows``-row load as log records."""
+        base = {"source": self.source, "loader_version": loader_version, **fields}
+        # Stages repeated per batch are logged once with their totals
+        for record in self.stage_totals().round(4).to_dict("records"):
+            load_logger.info(json.dumps({"event": "load_stage", **base, **record}))
+        load_logger.info(
+            json.dumps(
+                {
+                    "event": "load_complete",
+                    **base,
+                    "seconds": round(self.total_seconds, 4),
+                    "rows": rows,
+                    "bytes": self.file_bytes,
+                    "wall_seconds": round(time.perf_counter() - self._start, 4),
+                }
+            )
+        )
 
 
-# Suppress warnings for cleaner output
-warnings.filterwarnings("ignore")
+# Dataset files written by download_dataset.py. The Parquet dataset is used when present.
+data_file = "nypd_arrests_dataset.csv"
+parquet_dataset = "nypd_arrests_dataset.parquet"
+
+# The CSV may also be stored compressed (download_dataset.py --compression)
+data_files = [data_file] + [
+    data_file + suffix for suffix in compression_suffixes.values()
+]
+
+# Grouped-count summary table written by download_dataset.py --summary
+summary_file = "nypd_arrests_summary.parquet"
+
+# Name of the arrest count column in summary-only mode
+count_column = "ARRESTS"
+# Name of the column naming the rollup of each summary row, and the dashboard
+# names of the summary table's group columns
+rollup_column = "ROLLUP"
+summary_column_names = {
+    **column_mapping,
+    "year": "YEAR",
+    "month": "MONTH",
+    "day_of_week": "DAY_OF_WEEK",
+}
+# Summary columns derived from a group column, and their source
+summary_derived_columns = {"QUARTER": "MONTH", "AGE_GROUP_CLEAN": "AGE_GROUP"}
+
+# Name of the column holding a 64-bit hash of each arrest's source columns
+row_hash_column = "ROW_HASH"
+
+# Name of the column telling whether an arrest's coordinates can be mapped,
+# stored as 0/1 bytes since Arrow packs booleans into bits and a shared file
+# could not be mapped without unpacking them
+mappable_column = "MAPPABLE"
+
+# Columns sketched per arrest year at load time: distinct values, and value
+# ranges at a resolution (dates in milliseconds, so one day)
+sketched_categories = ["ARREST_BORO", "OFNS_DESC"]
+sketched_ranges = {"ARREST_DATE": 24 * 60 * 60 * 1000}
+
+# Small integer types of the derived date parts
+date_part_types = {"YEAR": "int16", "MONTH": "int8", "QUARTER": "int8"}
+# Day names in week order, as used for DAY_OF_WEEK
+day_names = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+# Directory of the on-disk cache of processed datasets
+cache_directory = ".nypd_cache"
+# Bytes at the end of a cached CSV that must be unchanged to extend its cache
+source_tail_bytes = 64 * 1024
+# Batch size of the out-of-core loader: rows per batch with the pandas parser,
+# bytes of CSV per batch with the Arrow parser
+chunk_rows = 100000
+chunk_bytes = 16 * 1024 * 1024
+# Number of geocoded arrests the out-of-core loader keeps for the map
+map_sample_size = 100000
+# Seconds between refreshes of the dashboard while a progressive load runs
+progress_refresh_seconds = 1.0
+
+# Structured load profiles (LoadProfile.log), one JSON object per line on stderr
+load_logger = logging.getLogger("nypd_dashboard.load")
+if not load_logger.handlers:
+    load_logger.addHandler(logging.StreamHandler())
+    load_logger.setLevel(logging.INFO)
+    load_logger.propagate = False
+# Version of the loader's processing; bump it whenever load_full_nypd_data
+# changes the frame it returns, so cached copies are rebuilt
+loader_version = 9
+
+# Page configuration
+st.set_page_config(
+    page_title="NYPD Arrests Dashboard",
+    page_icon="🚔",
+    layout="wide",
+    initial_sidebar_state="expanded",
+)
+
+# Custom CSS for better styling
+st.markdown(
+    """
+<style>
+    .main-header {
+        font-size: 3rem;
+        font-weight: bold;
+        color: #1F77B4;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .metric-card {
+        background-color: #F0F2F6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #1F77B4;
+    }
+    .info-box {
+        background-color: #E8F4FD;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #17A2B8;
+    }
+</style>
+""",
+    unsafe_allow_html=True,
+)
+
+
+def get_file_signature(file_path: str) -> Tuple[int, float]:
+    """Return the size and modification time of a data file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the data file, or to a Parquet dataset directory.
+
+    Returns
+    -------
+    Tuple[int, float]
+        File size in bytes and modification time, or ``(0, 0.0)`` if the file
+        does not exist. For a directory, the total size and the newest
+        modification time of the files in it.
+
+    Purpose
+    -------
+    Passed to the cached loader so that a file grown by
+    ``download_dataset.py --sync`` is re-read instead of served from the cache.
+    """
+    if os.path.isdir(file_path):
+        stats = [
+            os.stat(os.path.join(root, name))
+            for root, _, names in os.walk(file_path)
+            for name in names
+        ]
+        return (
+            sum(stat.st_size for stat in stats),
+            max((stat.st_mtime for stat in stats), default=0.0),
+        )
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return 0, 0.0
+    return stat.st_size, stat.st_mtime
+
+
+def csv_source_state(
+    file_path: str, lean: bool, size: Optional[int] = None
+) -> Dict[str, Any]:
+    """Describe the CSV contents a processed frame is built from.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the CSV file.
+    lean : bool
+        Whether the frame is loaded in lean mode.
+    size : Optional[int]
+        Length of the file's contents to describe; its current size if not
+        given.
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``bytes``, the length described, ``tail_sha256``, a checksum of the
+        last ``source_tail_bytes`` before it, ``complete_rows``, whether the
+        file can be extended there, the mode and ``loader_version``.
+        Stored with a processed frame, it tells whether a later version of
+        the file only has rows appended: the state of the new file at the old
+        length is then the same.
+    """
+    size = os.path.getsize(file_path) if size is None else size
+    with open(file_path, "rb") as raw:
+        raw.seek(max(size - source_tail_bytes, 0))
+        tail = raw.read(min(size, source_tail_bytes))
+    # A plain CSV can only be extended after a complete row
+    complete_rows = tail.endswith(b"\n") or detect_compression(file_path) is not None
+    return {
+        "bytes": size,
+        "tail_sha256": hashlib.sha256(tail).hexdigest(),
+        "complete_rows": complete_rows,
+        "lean": lean,
+        "loader_version": loader_version,
+    }
+
+
+def read_arrests_csv(
+    file_path: str, engine: str = "pyarrow", offset: int = 0
+) -> pd.DataFrame:
+    """Read the dashboard columns of the arrests CSV with their declared types.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the CSV file, plain or gzip/zstd compressed.
+    engine : str
+        ``"pyarrow"`` to parse with the multi-threaded Arrow CSV reader, or
+        ``"pandas"`` for the single-threaded pandas parser.
+    offset : int
+        Byte position of the first row to read, under the file's header. Rows
+        appended by ``download_dataset.py --sync`` start at the former size of
+        the file, in a gzip member or zstd frame of their own if compressed.
+
+    Returns
+    -------
+    pd.DataFrame
+        The columns of ``dashboard_columns`` present in the file, with
+        categorical text and float32 numbers. The Arrow reader also parses
+        ``arrest_date`` into datetimes; the pandas parser leaves it as text.
+
+    Purpose
+    -------
+    Both engines apply the same schema while parsing, so the rest of the
+    loader does not depend on which one was used. The Arrow reader splits
+    the file into blocks and parses them on all cores, which shortens cold
+    starts of the full dataset.
+    """
+    compression = detect_compression(file_path)
+    # Rows read from an offset get the column names of the file's header
+    header = None
+    if offset:
+        header = list(pd.read_csv(file_path, nrows=0, compression=compression).columns)
+    if engine == "pandas":
+        column_types = csv_column_types(dashboard_columns)
+        with open(file_path, "rb") as raw:
+            raw.seek(offset)
+            return pd.read_csv(
+                raw,
+                header=None if header else "infer",
+                names=header,
+                usecols=lambda column: column in column_types,
+                dtype=column_types,
+                compression=compression,
+            )
+
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    with pa.OSFile(file_path) as raw:
+        raw.seek(offset)
+        stream = pa.CompressedInputStream(raw, compression) if compression else raw
+        table = pa_csv.read_csv(
+            stream,
+            read_options=pa_csv.ReadOptions(use_threads=True, column_names=header),
+            convert_options=arrow_convert_options(file_path, compression),
+        )
+    # Dictionary columns become categoricals; columns are converted one by one
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def arrow_convert_options(file_path: str, compression: Optional[str] = None) -> Any:
+    """Return the Arrow CSV options that read the dashboard columns of a file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the CSV file.
+    compression : Optional[str]
+        Codec of the file, from ``detect_compression``.
+
+    Returns
+    -------
+    pyarrow.csv.ConvertOptions
+        The columns of ``dashboard_columns`` in the file's header order, with
+        the types of ``arrow_column_types``.
+    """
+    import pyarrow.csv as pa_csv
+
+    header = pd.read_csv(file_path, nrows=0, compression=compression).columns
+    return pa_csv.ConvertOptions(
+        include_columns=[c for c in header if c in dashboard_columns],
+        column_types=arrow_column_types(),
+        strings_can_be_null=True,
+    )
+
+
+def iter_arrests_csv(
+    file_path: str, engine: str = "pyarrow"
+) -> Iterator[Tuple[pd.DataFrame, float]]:
+    """Read the arrests CSV like ``read_arrests_csv``, one batch at a time.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the CSV file, plain or gzip/zstd compressed.
+    engine : str
+        ``"pyarrow"`` or ``"pandas"``; see ``read_arrests_csv``.
+
+    Returns
+    -------
+    Iterator[Tuple[pd.DataFrame, float]]
+        Consecutive batches of ``chunk_rows`` rows (pandas) or of the rows in
+        ``chunk_bytes`` of CSV (Arrow), with the same columns and types as
+        ``read_arrests_csv``, each with the fraction of the file read so far.
+        Only one batch is held in memory at a time.
+    """
+    compression = detect_compression(file_path)
+    file_size = max(os.path.getsize(file_path), 1)
+    if engine == "pandas":
+        column_types = csv_column_types(dashboard_columns)
+        with open(file_path, "rb") as raw:
+            with pd.read_csv(
+                raw,
+                usecols=lambda column: column in column_types,
+                dtype=column_types,
+                compression=compression,
+                chunksize=chunk_rows,
+            ) as reader:
+                for chunk in reader:
+                    yield chunk, min(raw.tell() / file_size, 1.0)
+        return
+
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    # Arrow's own streaming reader reads far ahead of the batches consumed, so
+    # blocks are cut at row boundaries here and each one is parsed on its own
+    convert_options = arrow_convert_options(file_path, compression)
+    with pa.OSFile(file_path) as raw:
+        stream = pa.CompressedInputStream(raw, compression) if compression else raw
+        read_options = None
+        rest = b""
+        while True:
+            # Read the next block in place behind the unfinished row of the last
+            data = bytearray(len(rest) + chunk_bytes)
+            data[: len(rest)] = rest
+            size = stream.readinto(memoryview(data)[len(rest) :])
+            del data[len(rest) + size :]
+            last = size == 0
+            start = 0
+            if read_options is None:
+                # Name the columns once, so the blocks are parsed without a copy
+                # of the header in front of them
+                start = data.find(b"\n") + 1
+                header = pa_csv.read_csv(pa.py_buffer(data[:start]))
+                read_options = pa_csv.ReadOptions(
+                    use_threads=True, column_names=header.column_names
+                )
+            # The last block ends the last row, even without a final line break
+            end = len(data) if last else start + complete_rows_end(data[start:])
+            rest = data[end:]
+            if end > start:
+                table = pa_csv.read_csv(
+                    pa.py_buffer(memoryview(data)[start:end]),
+                    read_options=read_options,
+                    convert_options=convert_options,
+                )
+                # Only the parsed batch is held while the caller works on it
+                del data
+                # Blocks of blank lines give no rows
+                if table.num_rows:
+                    chunk = table.to_pandas(split_blocks=True, self_destruct=True)
+                    del table
+                    yield chunk, min(raw.tell() / file_size, 1.0)
+                    del chunk
+            if last:
+                return
+
+
+def complete_rows_end(data: bytes) -> int:
+    """Return the length of the complete CSV rows at the start of ``data``.
+
+    Parameters
+    ----------
+    data : bytes
+        CSV text starting at the beginning of a row.
+
+    Returns
+    -------
+    int
+        Position just after the last line break outside a quoted field, or 0
+        if ``data`` holds no complete row. A line break is outside quotes when
+        an even number of quote characters precede it.
+    """
+    end = data.rfind(b"\n")
+    while end >= 0 and data.count(b'"', 0, end) % 2:
+        end = data.rfind(b"\n", 0, end)
+    return end + 1
+
+
+def concat_batches(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine batches of processed arrests into one frame.
+
+    Parameters
+    ----------
+    frames : List[pd.DataFrame]
+        Rows loaded so far and the batches after them, each from
+        ``prepare_arrests_frame``, with the same columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows of all frames with a fresh index, copied once. Categorical
+        columns stay categorical, with the union of all sets of categories,
+        where ``pd.concat`` would fall back to plain text. The validation
+        reports of all frames are added up.
+    """
+    columns = {}
+    for col in frames[0].columns:
+        parts = [frame[col] for frame in frames]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            columns[col] = pd.api.types.union_categoricals(parts)
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    combined = pd.DataFrame(columns)
+    report: List[Dict[str, Any]] = []
+    for frame in frames:
+        report = merge_validation_reports(
+            report, frame.attrs.get("validation_report", [])
+        )
+    combined.attrs["validation_report"] = report
+    return combined
+
+
+class BackgroundLoader:
+    """Load the full CSV dataset batch by batch in a background thread.
+
+    ``frame`` holds the rows processed so far, so the dashboard can render
+    from the first batch and refine while the rest loads. Processed batches
+    are only collected, and combined into ``frame`` when it is read, so the
+    rows are copied once per refresh of the dashboard rather than once per
+    batch. ``rows`` counts them meanwhile. ``total_rows`` is the row count
+    from the download manifest, or an estimate from the share of the file
+    read so far (``total_exact`` tells which). ``profile`` collects the
+    stages of every batch, and ``row_index`` the row hashes, so duplicates
+    are counted across batches. ``sketches`` holds the per-year sketches of
+    the whole dataset, built once from ``frame`` after the last batch and
+    published before ``done`` is set; it is empty while the load runs, when
+    the dashboard computes its statistics from the rows shown instead.
+    ``source_state`` is the state of the file when the load started, stored
+    with ``frame``. Once ``done`` is set, ``error`` holds the exception that
+    stopped the load, if any.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        column_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+        engine: str = "pyarrow",
+        lean: bool = True,
+        total_rows: Optional[int] = None,
+    ) -> None:
+        self.file_path = file_path
+        self.column_stats = column_stats
+        self.engine = engine
+        self.lean = lean
+        self.total_rows = total_rows
+        self.total_exact = total_rows is not None
+        self.source_state = csv_source_state(file_path, lean)
+        self.rows = 0
+        self.profile = LoadProfile(file_path)
+        self.row_index = RowHashIndex()
+        self.sketches: Dict[int, ColumnSketches] = {}
+        self.done = False
+        self.error: Optional[Exception] = None
+        self._frame: Optional[pd.DataFrame] = None
+        self._batches: List[pd.DataFrame] = []
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def frame(self) -> Optional[pd.DataFrame]:
+        """Rows processed so far, with the batches collected since the last read."""
+        with self._lock:
+            if self._batches:
+                frames = self._batches
+                if self._frame is not None:
+                    frames = [self._frame] + frames
+                self._frame = concat_batches(frames)
+                self._frame.attrs["source_state"] = self.source_state
+                self._batches = []
+            return self._frame
+
+    def cancel(self) -> None:
+        """Stop loading after the batch in progress."""
+        self._cancelled.set()
+
+    def _run(self) -> None:
+        try:
+            for chunk, fraction in iter_arrests_csv(self.file_path, self.engine):
+                if self._cancelled.is_set():
+                    return
+                self.profile.lap(f"read CSV ({self.engine})", len(chunk))
+                batch = prepare_arrests_frame(
+                    chunk, self.column_stats, self.lean, self.profile, self.row_index
+                )
+                del chunk
+                rows = self.rows + len(batch)
+                if not self.total_exact and fraction > 0:
+                    self.total_rows = max(round(rows / fraction), rows)
+                with self._lock:
+                    self._batches.append(batch)
+                self.rows = rows
+            if self.rows:
+                # Sketching the whole frame once costs a fraction of sketching
+                # every batch; readers see the finished sketches or none
+                frame = self.frame
+                self.profile.lap("combine batches", len(frame))
+                self.sketches = sketch_arrests(frame)
+                self.profile.lap("sketch dataset", len(frame))
+                self.total_rows = self.rows
+                # The batches together read the whole file
+                self.profile.file_bytes = os.path.getsize(self.file_path)
+                self.profile.log(
+                    self.rows,
+                    engine=self.engine,
+                    lean=self.lean,
+                    progressive=True,
+                )
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+
+
+def vocabulary_positions(values: pd.Series, vocabulary: Dict[Any, int]) -> np.ndarray:
+    """Map a batch of values to their positions in a growing vocabulary.
+
+    Parameters
+    ----------
+    values : pd.Series
+        One key column of a batch, categorical or numeric.
+    vocabulary : Dict[Any, int]
+        Position of every value seen so far, counting from 1. Values first
+        seen in this batch are added at the end.
+
+    Returns
+    -------
+    np.ndarray
+        The position of each row's value, 0 for missing values. Each distinct
+        value of the batch is looked up once; the rows follow by their codes.
+    """
+    codes, uniques = pd.factorize(values)
+    lookup = np.zeros(len(uniques) + 1, dtype=np.intp)
+    for i, value in enumerate(uniques):
+        lookup[i + 1] = vocabulary.setdefault(value, len(vocabulary) + 1)
+    return lookup[codes + 1]
+
+
+class RollupCounts:
+    """Arrest counts of one rollup of ``summary_rollups``, grown batch by batch.
+
+    The counts are one dense integer array with an axis per key column,
+    indexed by the ``vocabulary_positions`` of the values. ``add`` adds a
+    batch to it in place, so its size depends on the number of distinct
+    values of each key, never on the number of rows or batches.
+    """
+
+    def __init__(self, keys: List[str]) -> None:
+        self.keys = keys
+        self.counts = np.zeros([1] * len(keys), dtype=np.int64)
+
+    def add(
+        self, positions: Dict[str, np.ndarray], vocabularies: Dict[str, Dict[Any, int]]
+    ) -> None:
+        """Count a batch, given the positions of its values in each key column."""
+        # Axes grow by the values first seen in this batch
+        shape = tuple(len(vocabularies[key]) + 1 for key in self.keys)
+        if shape != self.counts.shape:
+            growth = [(0, new - old) for new, old in zip(shape, self.counts.shape)]
+            self.counts = np.pad(self.counts, growth)
+        cells = np.ravel_multi_index([positions[key] for key in self.keys], shape)
+        self.counts += np.bincount(cells, minlength=self.counts.size).reshape(shape)
+
+    def to_frame(self, vocabularies: Dict[str, Dict[Any, int]]) -> pd.DataFrame:
+        """Return the non-empty groups with their key values and counts."""
+        cells = np.nonzero(self.counts)
+        columns: Dict[str, Any] = {}
+        for key, positions in zip(self.keys, cells):
+            categories = pd.Index(list(vocabularies[key]))
+            values = pd.Categorical.from_codes(positions - 1, categories)
+            if pd.api.types.is_numeric_dtype(categories):
+                values = np.asarray(values, dtype=float)
+            columns[key] = values
+        columns[summary_count_column] = self.counts[cells]
+        return pd.DataFrame(columns)
+
+
+def aggregate_arrests_csv(
+    file_path: str, engine: str = "pyarrow", sample_size: int = map_sample_size
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Build the summary table and a map sample of the arrests CSV in one pass.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the CSV file, plain or gzip/zstd compressed.
+    engine : str
+        ``"pyarrow"`` or ``"pandas"``; see ``read_arrests_csv``.
+    sample_size : int
+        Maximum number of rows in the map sample.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]
+        The arrest counts of each rollup in ``summary_rollups``, in the layout
+        of the table written by ``download_dataset.py --summary``, and a uniform
+        random sample of at most ``sample_size`` rows with coordinates
+        (``arrest_date``, ``arrest_boro``, ``ofns_desc``, ``latitude``,
+        ``longitude``), under their raw column names.
+
+    Purpose
+    -------
+    The file is read batch by batch (``iter_arrests_csv``). Each batch is
+    added in place to one ``RollupCounts`` per rollup, whose size depends on
+    the distinct values of its keys only, and every row with coordinates gets
+    a random key, of which only the ``sample_size`` smallest are kept. Memory
+    therefore stays flat for files of any size: one batch plus these fixed
+    tables.
+    """
+    map_columns = ["arrest_date", "arrest_boro", "ofns_desc", "latitude", "longitude"]
+    rng = np.random.default_rng(42)
+    # Every key column of the rollups, each with one vocabulary
+    key_columns = list(
+        dict.fromkeys(key for keys in summary_rollups.values() for key in keys)
+    )
+    vocabularies: Dict[str, Dict[Any, int]] = {key: {} for key in key_columns}
+    rollups = {name: RollupCounts(keys) for name, keys in summary_rollups.items()}
+    sample = None
+    for chunk, _ in iter_arrests_csv(file_path, engine):
+        # Parse each distinct date once; invalid dates become NaT
+        dates = pd.DatetimeIndex(
+            derive_date_columns(chunk["arrest_date"], ["ARREST_DATE"])["ARREST_DATE"]
+        )
+        chunk["arrest_date"] = dates
+
+        # Count like date_extract_y/m/dow, which counts days from Sunday (0)
+        date_parts = {
+            "year": dates.year,
+            "month": dates.month,
+            "day_of_week": (dates.dayofweek + 1) % 7,
+        }
+        positions = {
+            key: vocabulary_positions(
+                pd.Series(date_parts[key] if key in date_parts else chunk[key]),
+                vocabularies[key],
+            )
+            for key in key_columns
+        }
+        for counts in rollups.values():
+            counts.add(positions, vocabularies)
+        del positions
+
+        # Keep the rows with the smallest random keys seen so far
+        located = chunk.loc[
+            mappable_coordinates(
+                chunk["latitude"], chunk["longitude"], chunk["arrest_boro"]
+            ),
+            map_columns,
+        ]
+        located = located.assign(sample_key=rng.random(len(located)))
+        if sample is not None:
+            if len(sample) >= sample_size:
+                located = located[located["sample_key"] < sample["sample_key"].max()]
+            located = pd.concat([sample, located])
+        sample = located.nsmallest(sample_size, "sample_key")
+
+    if sample is None:
+        raise ValueError(f"'{file_path}' has no rows")
+    summary = pd.concat(
+        [
+            counts.to_frame(vocabularies).assign(**{summary_rollup_column: name})
+            for name, counts in rollups.items()
+        ],
+        ignore_index=True,
+    )
+    return summary, sample.drop(columns="sample_key").reset_index(drop=True)
+
+
+def processed_cache_path(
+    file_path: str,
+    file_signature: Tuple[int, Union[float, str]],
+    years: Optional[Tuple[int, int]] = None,
+    lean: bool = True,
+    extension: str = ".feather",
+) -> str:
+    """Return the disk cache file of a processed dataset.
+
+    Parameters
+    ----------
+    file_path : str
+        Source CSV file or Parquet dataset.
+    file_signature : Tuple[int, Union[float, str]]
+        Size and modification time, or size and checksum, of the source.
+    years : Optional[Tuple[int, int]]
+        Year range loaded from a Parquet dataset.
+    lean : bool
+        Whether the frame was loaded in lean mode.
+    extension : str
+        ``".feather"`` for the compressed restart cache, ``".arrow"`` for the
+        memory-mapped shared dataset.
+
+    Returns
+    -------
+    str
+        ``<cache_directory>/<source>-<version>-<variant><extension>``, where
+        ``<source>`` hashes the absolute source path, ``<version>`` the
+        signature and ``loader_version``, and ``<variant>`` the year range and
+        the mode. Any change to them gives a new file name.
+    """
+    source = hashlib.sha256(os.path.abspath(file_path).encode()).hexdigest()[:16]
+    version = hashlib.sha256(
+        repr((file_signature, loader_version)).encode()
+    ).hexdigest()[:16]
+    variant = hashlib.sha256(repr((years, lean)).encode()).hexdigest()[:16]
+    return os.path.join(cache_directory, f"{source}-{version}-{variant}{extension}")
+
+
+def remove_stale_cache_entries(cache_path: str) -> None:
+    """Remove the cache files of the same source and kind from another version.
+
+    Parameters
+    ----------
+    cache_path : str
+        Cache file that was just written, from ``processed_cache_path``.
+
+    Returns
+    -------
+    None
+        Files in ``cache_directory`` with the same source prefix and extension
+        as ``cache_path`` but another ``<version>``, that is written from
+        another state of the source or by another ``loader_version``, are
+        deleted. The other year ranges and modes of the current version stay.
+        Processes that still map a deleted shared dataset keep reading it until
+        they close it.
+    """
+    source, version = os.path.basename(cache_path).split("-")[:2]
+    extension = os.path.splitext(cache_path)[1]
+    for name in os.listdir(cache_directory):
+        if (
+            name.startswith(f"{source}-")
+            and name.endswith(extension)
+            and not name.startswith(f"{source}-{version}-")
+        ):
+            os.remove(os.path.join(cache_directory, name))
+
+
+def appendable_cache_entry(file_path: str, lean: bool) -> Optional[Tuple[str, int]]:
+    """Find the disk cache of a CSV that has only had rows appended since.
+
+    Parameters
+    ----------
+    file_path : str
+        CSV file whose own cache entry is missing.
+    lean : bool
+        Whether the frame is loaded in lean mode.
+
+    Returns
+    -------
+    Optional[Tuple[str, int]]
+        The cache file of the same source and mode whose ``source_state``
+        still matches the start of the file, and the length of the file it
+        covers, or None. Only the state in the file's schema is read.
+
+    Purpose
+    -------
+    ``download_dataset.py --sync`` only appends rows, so the cached frame of
+    the file before the sync is still valid for its first rows. The file is
+    assumed to change only that way: an edit to older rows that leaves the
+    last ``source_tail_bytes`` before the old end unchanged is not noticed.
+    """
+    if os.path.isdir(file_path) or not os.path.isdir(cache_directory):
+        return None
+    import pyarrow as pa
+
+    source = os.path.basename(processed_cache_path(file_path, (0, 0.0))).split("-")[0]
+    size = os.path.getsize(file_path)
+    for name in sorted(os.listdir(cache_directory)):
+        if not (name.startswith(f"{source}-") and name.endswith(".feather")):
+            continue
+        path = os.path.join(cache_directory, name)
+        try:
+            with pa.memory_map(path) as source_file:
+                metadata = pa.ipc.open_file(source_file).schema.metadata
+            attributes = json.loads(metadata[b"pandas"]).get("attributes", {})
+        except Exception:
+            continue
+        state = attributes.get("source_state")
+        if (
+            state
+            and state["complete_rows"]
+            and state["bytes"] < size
+            and csv_source_state(file_path, lean, state["bytes"]) == state
+        ):
+            return path, state["bytes"]
+    return None
+
+
+def extend_processed_cache(
+    file_path: str,
+    entry: Tuple[str, int],
+    column_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    engine: str = "pyarrow",
+    lean: bool = True,
+    profile: Optional[LoadProfile] = None,
+) -> pd.DataFrame:
+    """Load a CSV grown by ``download_dataset.py --sync`` from its older cache.
+
+    Parameters
+    ----------
+    file_path : str
+        CSV file with rows appended since ``entry`` was written.
+    entry : Tuple[str, int]
+        Cache file and the length of the file it covers, from
+        ``appendable_cache_entry``.
+    column_stats : Optional[Dict[str, Dict[str, Any]]]
+        Column statistics from a matching download manifest.
+    engine : str
+        CSV parser, ``"pyarrow"`` or ``"pandas"``.
+    lean : bool
+        Whether to rename columns in place and drop unused ones.
+    profile : Optional[LoadProfile]
+        Receives one lap per stage.
+
+    Returns
+    -------
+    pd.DataFrame
+        The same frame as ``process_full_nypd_data`` would build from the
+        whole file. Only the appended rows are parsed, processed and hashed;
+        the cached rows keep their stored ``row_hash_column``, against which
+        the new rows are checked for duplicates.
+    """
+    profile = profile if profile is not None else LoadProfile(file_path)
+    cache_path, offset = entry
+    state = csv_source_state(file_path, lean)
+    cached = pd.read_feather(cache_path)
+    profile.lap("read disk cache", len(cached), os.path.getsize(cache_path))
+    appended = read_arrests_csv(file_path, engine, offset)
+    profile.lap(f"read appended CSV ({engine})", len(appended), state["bytes"] - offset)
+
+    row_index = RowHashIndex()
+    row_index.add(cached[row_hash_column].to_numpy())
+    batch = prepare_arrests_frame(appended, column_stats, lean, profile, row_index)
+    df = concat_batches([cached, batch])
+    df.attrs["source_state"] = state
+    profile.lap("append to cache", len(df))
+    st.info(
+        f"Loaded full dataset: {len(df):,} rows "
+        f"({len(batch):,} appended since the disk cache)"
+    )
+    return df
+
+
+def save_processed_cache(df: pd.DataFrame, cache_path: str) -> None:
+    """Write a processed dataset to the disk cache.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Frame returned by ``load_full_nypd_data``.
+    cache_path : str
+        Destination, from ``processed_cache_path``.
+
+    Returns
+    -------
+    None
+        The frame is written as LZ4-compressed Feather (Arrow IPC), which keeps
+        categorical and datetime columns and reads back in a fraction of the
+        time of a full load. Older entries of the same source are removed.
+        A failed write only shows a warning; the dashboard works without it.
+    """
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        df.to_feather(f"{cache_path}.part", compression="lz4")
+        os.replace(f"{cache_path}.part", cache_path)
+
+        # Entries of the same source with another key are stale
+        remove_stale_cache_entries(cache_path)
+    except Exception as e:
+        st.warning(f"Could not write the dataset cache: {e}")
+
+
+def save_shared_dataset(df: pd.DataFrame, shared_path: str) -> None:
+    """Write a processed dataset as a memory-mappable Arrow file.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Frame returned by ``process_full_nypd_data``.
+    shared_path : str
+        Destination, from ``processed_cache_path`` with ``extension=".arrow"``.
+
+    Returns
+    -------
+    None
+        The frame is written as one uncompressed Arrow IPC record batch, the
+        layout ``open_shared_dataset`` can map without copying. Missing dates
+        and numbers are stored as NaT and NaN values rather than as a validity
+        bitmap, which pandas would have to resolve into a copy. The file is
+        written under a per-process name and renamed into place, so
+        concurrent workers never see a partial file. Older entries of the
+        same source are removed.
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+    for i, field in enumerate(table.schema):
+        is_numpy_type = pa.types.is_timestamp(field.type) or pa.types.is_floating(
+            field.type
+        )
+        if is_numpy_type and table.column(i).null_count:
+            values = df[field.name].to_numpy().view("uint8")
+            column = pa.Array.from_buffers(
+                field.type, len(df), [None, pa.py_buffer(values)]
+            )
+            table = table.set_column(i, field, column)
+
+    os.makedirs(cache_directory, exist_ok=True)
+    part_path = f"{shared_path}.{os.getpid()}.part"
+    with pa.OSFile(part_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=max(len(df), 1))
+    os.replace(part_path, shared_path)
+
+    # Entries of the same source with another key are stale
+    remove_stale_cache_entries(shared_path)
+
+
+def open_shared_dataset(shared_path: str) -> pd.DataFrame:
+    """Open a dataset written by ``save_shared_dataset`` without copying it.
+
+    Parameters
+    ----------
+    shared_path : str
+        Arrow file written by ``save_shared_dataset``.
+
+    Returns
+    -------
+    pd.DataFrame
+        Frame whose columns are read-only views of the memory-mapped file.
+
+    Purpose
+    -------
+    The file's pages live in the operating system's page cache, so every
+    process that opens it shares one physical copy of the dataset, and
+    opening it costs no parsing. Pages are read from disk on first access.
+    """
+    import pyarrow as pa
+
+    with pa.memory_map(shared_path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    # The frame keeps the mapping alive after the file object is closed
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def prepare_arrests_frame(
+    df: pd.DataFrame,
+    column_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    lean: bool = True,
+    profile: Optional[LoadProfile] = None,
+    row_index: Optional[RowHashIndex] = None,
+) -> pd.DataFrame:
+    """Rename, parse and clean arrests as read by ``read_arrests_csv``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The whole dataset, or one batch of it from ``iter_arrests_csv``.
+    column_stats : Optional[Dict[str, Dict[str, Any]]]
+        Column statistics from a matching download manifest.
+    lean : bool
+        Whether to rename columns in place and drop unused ones.
+    profile : Optional[LoadProfile]
+        Receives one lap per processing stage.
+    row_index : Optional[RowHashIndex]
+        Hashes of the rows of earlier batches, updated with this one. A new
+        index is used if not given.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows of ``df`` with the dashboard's column names, parsed dates and
+        standardized categories, plus ``row_hash_column`` and
+        ``mappable_column``. Each row is
+        processed on its own, so batches processed separately and
+        concatenated give the same frame. Rows repeating an earlier row are
+        counted in the validation report.
+    """
+    profile = profile if profile is not None else LoadProfile()
+    row_index = row_index if row_index is not None else RowHashIndex()
+
+    # Rename columns to match expected names
+    if lean:
+        # Rename in place and drop the source columns the dashboard never reads
+        df = df.rename(columns=column_mapping)
+        unused = [col for col in df.columns if col not in column_mapping.values()]
+        df = df.drop(columns=unused)
+    else:
+        for old_name, new_name in column_mapping.items():
+            if old_name in df.columns:
+                df[new_name] = df[old_name]
+    profile.lap("rename columns", len(df))
+
+    # Process arrest date. YEAR, MONTH, DAY_OF_WEEK and QUARTER are derived
+    # from it on first use (see DatePartsAccessor)
+    if "ARREST_DATE" in df.columns:
+        try:
+            # Parse each distinct date once; invalid dates become NaT
+            dates = derive_date_columns(df["ARREST_DATE"], ["ARREST_DATE"])
+            df["ARREST_DATE"] = dates["ARREST_DATE"]
+        except Exception as e:
+            st.warning(f"Date processing warning: {str(e)}")
+            # Without dates the date parts get dummy values
+            df = df.drop(columns="ARREST_DATE")
+    profile.lap("parse dates", len(df))
+
+    # Clean and standardize categorical columns
+    try:
+        if "ARREST_BORO" in df.columns:
+            df["ARREST_BORO"] = standardize_text_column(df["ARREST_BORO"], upper=True)
+        if "PERP_SEX" in df.columns:
+            df["PERP_SEX"] = standardize_text_column(df["PERP_SEX"], upper=True)
+        if "LAW_CAT_CD" in df.columns:
+            df["LAW_CAT_CD"] = standardize_text_column(df["LAW_CAT_CD"], upper=True)
+        if "OFNS_DESC" in df.columns:
+            df["OFNS_DESC"] = standardize_text_column(df["OFNS_DESC"])
+
+    except Exception as e:
+        st.warning(f"Some categorical columns could not be standardized: {e}")
+    profile.lap("standardize categories", len(df))
+
+    # Create age group mapping for better analysis. The result is categorical
+    # like the other text columns, so it stays a view in the shared dataset
+    unknown_ages = pd.Categorical.from_codes(np.zeros(len(df), np.int8), ["Unknown"])
+    try:
+        if "AGE_GROUP" in df.columns:
+            age_mapping = {
+                "18-24": "18-24",
+                "25-44": "25-44",
+                "45-64": "45-64",
+                "65+": "65+",
+                "<18": "<18",
+            }
+            # Map each category once; missing values have code -1, which picks
+            # the trailing "Unknown" entry
+            ages = df["AGE_GROUP"].astype("category")
+            lookup = (
+                ages.cat.categories.astype(str)
+                .map(age_mapping)
+                .fillna("Unknown")
+                .append(pd.Index(["Unknown"]))
+            )
+            uniques = lookup.unique()
+            codes = uniques.get_indexer(lookup)[ages.cat.codes.to_numpy()]
+            df["AGE_GROUP_CLEAN"] = pd.Categorical.from_codes(codes, uniques)
+        else:
+            df["AGE_GROUP_CLEAN"] = unknown_ages
+    except Exception as e:
+        st.warning(f"Age group mapping failed: {e}")
+        df["AGE_GROUP_CLEAN"] = unknown_ages
+    profile.lap("map age groups", len(df))
+
+    # Validate and clean the data before returning. The report travels with
+    # the frame, also through the disk cache
+    clean_df, report = validate_and_clean_data(df, column_stats)
+    profile.lap("validate and clean", len(clean_df))
+
+    # Hash each row once; duplicates are found against the batches before
+    hashes = row_hashes(clean_df)
+    duplicates = int(row_index.add(hashes).sum())
+    clean_df[row_hash_column] = hashes
+    report.append(
+        {
+            "column": "all columns",
+            "check": "duplicates",
+            "rule": "no repeated rows",
+            "failed_rows": duplicates,
+            "action": "kept",
+        }
+    )
+    profile.lap("hash rows", len(clean_df))
+
+    # Check the coordinates once, so the map only has to select the rows
+    if "latitude" in clean_df.columns and "longitude" in clean_df.columns:
+        in_city = mappable_coordinates(clean_df["latitude"], clean_df["longitude"])
+        borough = clean_df["ARREST_BORO"] if "ARREST_BORO" in clean_df.columns else None
+        mappable = mappable_coordinates(
+            clean_df["latitude"], clean_df["longitude"], borough
+        )
+        clean_df[mappable_column] = mappable.astype(np.uint8)
+        report.append(
+            {
+                "column": "latitude, longitude",
+                "check": "borough",
+                "rule": "inside the arrest borough",
+                "failed_rows": int((in_city & ~mappable).sum()),
+                "action": "kept, not mapped",
+            }
+        )
+    clean_df.attrs["validation_report"] = report
+    profile.lap("map coordinates", len(clean_df))
+    return clean_df
+
+
+def process_full_nypd_data(
+    file_path: str,
+    years: Optional[Tuple[int, int]] = None,
+    column_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    engine: str = "pyarrow",
+    lean: bool = True,
+    profile: Optional[LoadProfile] = None,
+) -> pd.DataFrame:
+    """Read the full NYPD arrests dataset and prepare it for the dashboard.
+
+    Parameters
+    ----------
+    file_path : str
+        CSV file or Parquet dataset; see ``load_full_nypd_data``.
+    years : Optional[Tuple[int, int]]
+        Year range to load from a Parquet dataset.
+    column_stats : Optional[Dict[str, Dict[str, Any]]]
+        Column statistics from a matching download manifest.
+    engine : str
+        CSV parser, ``"pyarrow"`` or ``"pandas"``.
+    lean : bool
+        Whether to rename columns in place and drop unused ones.
+    profile : Optional[LoadProfile]
+        Receives one lap for reading the source and one per processing stage.
+
+    Returns
+    -------
+    pd.DataFrame
+        Processed dataset, uncached. ``load_full_nypd_data`` and
+        ``load_shared_nypd_data`` cache it in their own way.
+    """
+    profile = profile if profile is not None else LoadProfile(file_path)
+    source_state = None
+
+    # Load the full dataset
+    if os.path.isdir(file_path):
+        filters = None
+        if years is not None:
+            filters = [
+                (partition_column, ">=", years[0]),
+                (partition_column, "<=", years[1]),
+            ]
+        df = pd.read_parquet(file_path, filters=filters)
+        profile.lap("read Parquet", len(df))
+    else:
+        # Only read the columns the dashboard uses, with their declared types:
+        # categorical text, float32 numbers. Compressed files are
+        # decompressed while they are parsed. The file's state lets a later
+        # load with rows appended reuse the cached frame
+        source_state = csv_source_state(file_path, lean)
+        df = read_arrests_csv(file_path, engine)
+        profile.lap(f"read CSV ({engine})", len(df), os.path.getsize(file_path))
+    if column_stats:
+        st.info(f"Loaded full dataset: {len(df):,} rows (checked by download manifest)")
+    else:
+        st.info(f"Loaded full dataset: {len(df):,} rows")
+
+    memory_as_read = df.memory_usage(deep=True).sum() / 1024 / 1024
+
+    # Rename columns, parse dates, standardize categories and validate
+    clean_df = prepare_arrests_frame(df, column_stats, lean, profile)
+    if source_state is not None:
+        clean_df.attrs["source_state"] = source_state
+    memory_processed = clean_df.memory_usage(deep=True).sum() / 1024 / 1024
+    mode = " (lean mode)" if lean else ""
+    st.info(
+        f"Memory usage: {memory_as_read:.1f} MB as read, "
+        f"{memory_processed:.1f} MB processed{mode}"
+    )
+    return clean_df
+
+
+@st.cache_data
+def load_full_nypd_data(
+    file_path: str,
+    file_signature: Tuple[int, Union[float, str]] = (0, 0.0),
+    years: Optional[Tuple[int, int]] = None,
+    column_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    engine: str = "pyarrow",
+    lean: bool = True,
+    _profile: Optional[LoadProfile] = None,
+) -> pd.DataFrame:
+    """Load the full NYPD arrests dataset from CSV file with caching.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the CSV file containing the NYPD arrests dataset (plain, gzip or
+        zstd compressed), or to the year-partitioned Parquet dataset written by
+        ``download_dataset.py --format parquet``.
+    file_signature : Tuple[int, Union[float, str]]
+        Size and modification time of the file, from ``get_file_signature``,
+        or size and checksum from a matching download manifest.
+        Only used as part of the cache key.
+    years : Optional[Tuple[int, int]]
+        First and last arrest year to load (inclusive). Only applies to the
+        Parquet dataset, where partitions outside the range are not read.
+    column_stats : Optional[Dict[str, Dict[str, Any]]]
+        Column statistics from a download manifest that matches the file,
+        passed on to ``validate_and_clean_data``.
+    engine : str
+        CSV parser, ``"pyarrow"`` or ``"pandas"``; see ``read_arrests_csv``.
+    lean : bool
+        If True, rename the source columns in place and drop the ones the
+        dashboard never reads, instead of keeping a lower-case copy of every
+        renamed column next to the upper-case one.
+    _profile : Optional[LoadProfile]
+        Receives the stages of the load, which are also logged. Left empty
+        when the frame comes from Streamlit's cache, which ignores arguments
+        starting with an underscore in its key.
+
+    Returns
+    -------
+    pd.DataFrame
+        Full dataset with optimized data types, processed columns, and temporal features.
+
+    Purpose
+    -------
+    This function loads the entire NYPD arrests dataset once and caches it for performance.
+    It processes column names, converts dates, creates temporal features, and standardizes
+    categorical data. The cached result prevents reloading the same data multiple times.
+    The processed frame is also cached on disk (see ``processed_cache_path``), so
+    restarting the app reads it back instead of processing the source again.
+    """
+    try:
+        profile = _profile if _profile is not None else LoadProfile(file_path)
+
+        # A processed copy on disk skips parsing and deriving columns
+        cache_path = processed_cache_path(file_path, file_signature, years, lean)
+        if os.path.exists(cache_path):
+            df = pd.read_feather(cache_path)
+            profile.lap("read disk cache", len(df), os.path.getsize(cache_path))
+            profile.log(len(df), engine=engine, lean=lean, cached=True)
+            st.info(f"Loaded full dataset: {len(df):,} rows (from disk cache)")
+            return df
+
+        # A cache of the file before a --sync only needs the new rows
+        entry = appendable_cache_entry(file_path, lean) if years is None else None
+        if entry is not None:
+            df = extend_processed_cache(
+                file_path, entry, column_stats, engine, lean, profile
+            )
+        else:
+            df = process_full_nypd_data(
+                file_path, years, column_stats, engine, lean, profile
+            )
+        save_processed_cache(df, cache_path)
+        profile.lap("write disk cache", len(df))
+        profile.log(len(df), engine=engine, lean=lean, cached=False)
+        return df
+
+    except FileNotFoundError:
+        st.error(f"Error: File '{file_path}' not found!")
+        st.stop()
+    except Exception as e:
+        st.error(f"Error loading dataset: {str(e)}")
+        st.stop()
 
 
-def validate_and_clean_data(df: pd.DataFrame) -> pd.DataFrame:
-    """Validate and clean the dataset to prevent data type errors.
+@st.cache_resource
+def load_shared_nypd_data(
+    file_path: str,
+    file_signature: Tuple[int, Union[float, str]] = (0, 0.0),
+    years: Optional[Tuple[int, int]] = None,
+    column_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+    engine: str = "pyarrow",
+    lean: bool = True,
+) -> pd.DataFrame:
+    """Load the full dataset as a memory-mapped file shared between processes.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        Raw dataset that needs validation and cleaning.
+    file_path : str
+        CSV file or Parquet dataset; see ``load_full_nypd_data``.
+    file_signature : Tuple[int, Union[float, str]]
+        Size and modification time, or size and checksum, of the source.
+        Only used as part of the cache key and the shared file name.
+    years : Optional[Tuple[int, int]]
+        Year range to load from a Parquet dataset.
+    column_stats : Optional[Dict[str, Dict[str, Any]]]
+        Column statistics from a matching download manifest.
+    engine : str
+        CSV parser, ``"pyarrow"`` or ``"pandas"``.
+    lean : bool
+        Whether to rename columns in place and drop unused ones.
 
     Returns
     -------
     pd.DataFrame
-        Cleaned dataset with validated data types and standardized formats.
+        The same frame as ``load_full_nypd_data``, backed by a read-only
+        memory map of ``<cache_directory>/<source>-<key>.arrow``.
 
     Purpose
     -------
-    This function ensures data quality by validating data types, handling missing values,
-    and standardizing categorical columns to prevent errors in downstream analysis.
+    With several Streamlit processes serving the dashboard, ``st.cache_data``
+    keeps a private copy of the full dataset in each of them. Here the first
+    process to load a source writes the processed frame once as an
+    uncompressed Arrow file, and every process maps that file, so the
+    operating system holds a single copy and a new worker starts without
+    parsing anything. ``st.cache_resource`` hands the same frame to every
+    session of a process instead of a copy; the frame must not be modified.
     """
     try:
-        # Create a copy to avoid modifying the original
-        clean_df = df.copy()
-
-        # Ensure all categorical columns are strings
-        categorical_cols = [
-            "ARREST_BORO",
-            "PERP_SEX",
-            "LAW_CAT_CD",
-            "OFNS_DESC",
-            "PERP_RACE",
-            "AGE_GROUP",
-        ]
-        for col in categorical_cols:
-            if col in clean_df.columns:
-                clean_df[col] = clean_df[col].fillna("Unknown").astype(str)
-
-        # Handle coordinate columns
-        if "latitude" in clean_df.columns:
-            clean_df["latitude"] = pd.to_numeric(clean_df["latitude"], errors="coerce")
-        if "longitude" in clean_df.columns:
-            clean_df["longitude"] = pd.to_numeric(
-                clean_df["longitude"], errors="coerce"
-            )
-
-        return clean_df
+        shared_path = processed_cache_path(
+            file_path, file_signature, years, lean, extension=".arrow"
+        )
+        if not os.path.exists(shared_path):
+            df = process_full_nypd_data(file_path, years, column_stats, engine, lean)
+            save_shared_dataset(df, shared_path)
+            del df
 
-    except Exception as e:
-        st.warning(f"Data validation warning: {str(e)}")
+        df = open_shared_dataset(shared_path)
+        st.info(f"Opened shared dataset: {len(df):,} rows (memory-mapped)")
         return df
 
-
-# Page configuration
-st.set_page_config(
-    page_title="NYPD Arrests Dashboard",
-    page_icon="🚔",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
-
-# Custom CSS for better styling
-st.markdown(
-    """
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        color: #1F77B4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background-color: #F0F2F6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1F77B4;
-    }
-    .info-box {
-        background-color: #E8F4FD;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #17A2B8;
-    }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+    except FileNotFoundError:
+        st.error(f"Error: File '{file_path}' not found!")
+        st.stop()
+    except Exception as e:
+        st.error(f"Error loading dataset: {str(e)}")
+        st.stop()
 
 
 @st.cache_data
-def load_full_nypd_data(file_path: str) -> pd.DataFrame:
-    """Load the full NYPD arrests dataset from CSV file with caching.
+def load_chunked_nypd_data(
+    file_path: str,
+    file_signature: Tuple[int, Union[float, str]] = (0, 0.0),
+    engine: str = "pyarrow",
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Load arrest counts and a map sample from a CSV of any size.
 
     Parameters
     ----------
     file_path : str
-        Path to the CSV file containing the NYPD arrests dataset.
+        Path to the CSV file, plain or gzip/zstd compressed.
+    file_signature : Tuple[int, Union[float, str]]
+        Size and modification time, or size and checksum, of the file.
+        Only used as part of the cache key.
+    engine : str
+        CSV parser, ``"pyarrow"`` or ``"pandas"``.
 
     Returns
     -------
-    pd.DataFrame
-        Full dataset with optimized data types, processed columns, and temporal features.
+    Tuple[pd.DataFrame, pd.DataFrame]
+        The grouped counts, laid out like ``load_summary_data``, and up to
+        ``map_sample_size`` arrests with coordinates for the map.
 
     Purpose
     -------
-    This function loads the entire NYPD arrests dataset once and caches it for performance.
-    It processes column names, converts dates, creates temporal features, and standardizes
-    categorical data. The cached result prevents reloading the same data multiple times.
+    ``load_full_nypd_data`` needs the whole dataset in memory. This loader
+    streams the file through ``aggregate_arrests_csv`` instead, which holds one
+    batch, a fixed-size count table per rollup and the map sample, so its
+    memory use stays flat however many rows the file has. The tabs work on the
+    counts as in summary-only mode, and the map plots the sample.
     """
     try:
-        # Load the full dataset
-        df = pd.read_csv(file_path)
-        st.info(f"Loaded full dataset: {len(df):,} rows")
+        summary, sample = aggregate_arrests_csv(file_path, engine)
+        df = prepare_summary_table(summary)
+
+        map_df = sample.rename(columns=column_mapping)
+        map_df["ARREST_BORO"] = standardize_text_column(
+            map_df["ARREST_BORO"], upper=True
+        )
+        map_df["OFNS_DESC"] = standardize_text_column(map_df["OFNS_DESC"])
+        map_df[mappable_column] = np.uint8(1)
+
+        st.info(
+            f"Aggregated {count_arrests(df):,} arrests into {len(df):,} groups "
+            f"(out-of-core), keeping {len(map_df):,} for the map"
+        )
+        return df, map_df
+
+    except FileNotFoundError:
+        st.error(f"Error: File '{file_path}' not found!")
+        st.stop()
+    except Exception as e:
+        st.error(f"Error loading dataset: {str(e)}")
+        st.stop()
+
+
+def prepare_summary_table(summary: pd.DataFrame) -> pd.DataFrame:
+    """Give a grouped-count table the dashboard's column names and types.
+
+    Parameters
+    ----------
+    summary : pd.DataFrame
+        The rollups of ``summary_rollups`` stacked, with the rollup name in
+        ``summary_rollup_column`` and the count in ``summary_count_column``,
+        as written by ``download_dataset.py --summary`` or built by
+        ``aggregate_arrests_csv``.
 
-        # Map actual column names to expected names for consistency
-        column_mapping = {
-            "arrest_date": "ARREST_DATE",
-            "arrest_boro": "ARREST_BORO",
-            "age_group": "AGE_GROUP",
-            "perp_sex": "PERP_SEX",
-            "perp_race": "PERP_RACE",
-            "ofns_desc": "OFNS_DESC",
-            "law_cat_cd": "LAW_CAT_CD",
-            "jurisdiction_code": "JURISDICTION_CODE",
-            "latitude": "latitude",
-            "longitude": "longitude",
+    Returns
+    -------
+    pd.DataFrame
+        One row per group, see ``load_summary_data``. Columns a row's rollup
+        does not group by are missing.
+    """
+    df = summary.rename(columns=column_mapping).rename(
+        columns={
+            summary_count_column: count_column,
+            summary_rollup_column: rollup_column,
         }
+    )
+    df[rollup_column] = df[rollup_column].astype("category")
+
+    # Drop groups without a valid arrest date
+    df = df.dropna(subset=["year"]).reset_index(drop=True)
+    df["YEAR"] = df["year"].astype(date_part_types["YEAR"])
+    # Only the month rollup has months; the other rollups are dated by year
+    df["MONTH"] = df["month"].astype("float32")
+    df["QUARTER"] = (df["MONTH"] - 1) // 3 + 1
+    df["ARREST_DATE"] = pd.to_datetime(
+        pd.DataFrame({"year": df["YEAR"], "month": df["MONTH"].fillna(1), "day": 1})
+    )
+    # date_extract_dow counts from Sunday (0)
+    sunday_first = pd.Series(day_names[-1:] + day_names[:-1])
+    day_of_week = sunday_first.reindex(df["day_of_week"].to_numpy()).fillna("Unknown")
+    df["DAY_OF_WEEK"] = pd.Categorical(
+        day_of_week.where((df[rollup_column] == "day_of_week").to_numpy()),
+        categories=day_names + ["Unknown"],
+    )
+    df = df.drop(columns=["year", "month", "day_of_week"])
+
+    # Text columns are standardized in the rollups that group by them
+    for key, col in column_mapping.items():
+        if col not in df.columns or key not in summary_groups:
+            continue
+        grouped = df[rollup_column].isin(
+            [name for name, keys in summary_rollups.items() if key in keys]
+        )
+        upper = col in ["ARREST_BORO", "PERP_SEX"]
+        df[col] = standardize_text_column(df.loc[grouped, col], upper).reindex(df.index)
+    age_groups = ["18-24", "25-44", "45-64", "65+", "<18"]
+    age_group_clean = (
+        df["AGE_GROUP"].astype(str).where(lambda s: s.isin(age_groups), "Unknown")
+    )
+    df["AGE_GROUP_CLEAN"] = pd.Categorical(
+        age_group_clean.where(df["AGE_GROUP"].notna())
+    )
+    return df
 
-        # Rename columns to match expected names
-        for old_name, new_name in column_mapping.items():
-            if old_name in df.columns:
-                df[new_name] = df[old_name]
 
-        # Process arrest date
-        if "ARREST_DATE" in df.columns:
-            try:
-                # Convert date column to datetime with error handling
-                df["ARREST_DATE"] = pd.to_datetime(df["ARREST_DATE"], errors="coerce")
+def sketch_arrests(df: pd.DataFrame) -> Dict[int, ColumnSketches]:
+    """Sketch processed arrests per arrest year.
 
-                # Only create temporal features for valid dates
-                valid_dates = df["ARREST_DATE"].dropna()
-                if len(valid_dates) > 0:
-                    # Extract additional temporal features only for valid dates
-                    df["YEAR"] = df["ARREST_DATE"].dt.year.fillna(2024)
-                    df["MONTH"] = df["ARREST_DATE"].dt.month.fillna(1)
-                    df["DAY_OF_WEEK"] = (
-                        df["ARREST_DATE"].dt.day_name().fillna("Unknown")
-                    )
-                    df["QUARTER"] = df["ARREST_DATE"].dt.quarter.fillna(1)
-                else:
-                    # Create dummy temporal features if no valid dates
-                    df["YEAR"] = 2024
-                    df["MONTH"] = 1
-                    df["DAY_OF_WEEK"] = "Unknown"
-                    df["QUARTER"] = 1
-            except Exception as e:
-                st.warning(f"Date processing warning: {str(e)}")
-                # Create dummy temporal features if date parsing fails
-                df["YEAR"] = 2024
-                df["MONTH"] = 1
-                df["DAY_OF_WEEK"] = "Unknown"
-                df["QUARTER"] = 1
-        else:
-            # Create dummy temporal features if no date column
-            df["YEAR"] = 2024
-            df["MONTH"] = 1
-            df["DAY_OF_WEEK"] = "Unknown"
-            df["QUARTER"] = 1
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Processed arrests, or one batch of them.
 
-        # Clean and standardize categorical columns
-        try:
-            if "ARREST_BORO" in df.columns:
-                df["ARREST_BORO"] = (
-                    df["ARREST_BORO"].fillna("Unknown").astype(str).str.upper()
-                )
-            if "PERP_SEX" in df.columns:
-                df["PERP_SEX"] = (
-                    df["PERP_SEX"].fillna("Unknown").astype(str).str.upper()
-                )
-            if "LAW_CAT_CD" in df.columns:
-                df["LAW_CAT_CD"] = (
-                    df["LAW_CAT_CD"].fillna("Unknown").astype(str).str.upper()
-                )
-            if "OFNS_DESC" in df.columns:
-                df["OFNS_DESC"] = df["OFNS_DESC"].fillna("Unknown").astype(str)
+    Returns
+    -------
+    Dict[int, ColumnSketches]
+        Arrest year (-1 for rows without a date) to the sketches of
+        ``sketched_categories`` and ``sketched_ranges`` for its rows. Empty
+        if the frame has no arrest dates.
+    """
+    if "ARREST_DATE" not in df.columns:
+        return {}
+    dates = df["ARREST_DATE"].to_numpy(dtype="datetime64[Y]")
+    years = np.where(np.isnat(dates), -1, dates.astype(np.int64) + 1970)
+    return sketch_partitions(df, years, sketched_categories, sketched_ranges)
 
-        except Exception as e:
-            st.warning(f"Some categorical columns could not be standardized: {e}")
 
-        # Create age group mapping for better analysis
-        try:
-            if "AGE_GROUP" in df.columns:
-                age_mapping = {
-                    "18-24": "18-24",
-                    "25-44": "25-44",
-                    "45-64": "45-64",
-                    "65+": "65+",
-                    "<18": "<18",
-                }
-                df["AGE_GROUP_CLEAN"] = (
-                    df["AGE_GROUP"].astype(str).map(age_mapping).fillna("Unknown")
-                )
-            else:
-                df["AGE_GROUP_CLEAN"] = "Unknown"
-        except Exception as e:
-            st.warning(f"Age group mapping failed: {e}")
-            df["AGE_GROUP_CLEAN"] = "Unknown"
+@st.cache_resource
+def load_dataset_sketches(
+    load_key: Tuple[Any, ...], _df: pd.DataFrame
+) -> Dict[int, ColumnSketches]:
+    """Sketch a loaded dataset once and share the sketches between sessions.
+
+    Parameters
+    ----------
+    load_key : Tuple[Any, ...]
+        Source, signature and options the dataset was loaded with; the cache
+        key.
+    _df : pd.DataFrame
+        The loaded dataset. Left out of the cache key.
+
+    Returns
+    -------
+    Dict[int, ColumnSketches]
+        ``sketch_arrests(_df)``. The sketches must not be modified.
+    """
+    return sketch_arrests(_df)
+
+
+def sketch_view(
+    partitions: Optional[Dict[int, ColumnSketches]],
+    start_date: datetime,
+    end_date: datetime,
+) -> Optional[ColumnSketches]:
+    """Merge the sketches of the years a date range covers.
+
+    Parameters
+    ----------
+    partitions : Optional[Dict[int, ColumnSketches]]
+        Sketches per arrest year, from ``sketch_arrests``.
+    start_date : datetime
+        First day of the range.
+    end_date : datetime
+        Last day of the range.
+
+    Returns
+    -------
+    Optional[ColumnSketches]
+        Sketches of the range, or None without partition sketches. Distinct
+        values cover the whole first and last year; date ranges are cut to
+        the days of the range.
+    """
+    if not partitions:
+        return None
+    view = ColumnSketches(sketched_categories, sketched_ranges)
+    for year, sketch in partitions.items():
+        if start_date.year <= year <= end_date.year:
+            view.merge(sketch)
+    dates = view.quantiles["ARREST_DATE"]
+    view.quantiles["ARREST_DATE"] = dates.restrict(
+        np.datetime64(start_date, "ms").astype(np.int64),
+        np.datetime64(end_date, "ms").astype(np.int64),
+    )
+    return view
+
+
+def present_values(series: pd.Series) -> List[str]:
+    """Return the distinct values of a column as sorted text.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column to list the values of.
+
+    Returns
+    -------
+    List[str]
+        Values that occur at least once, missing values left out.
+        Categorical columns count their codes instead of converting every
+        row to text.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        used = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+        return sorted(series.cat.categories[used > 0].astype(str))
+    return sorted(series.dropna().astype(str).unique())
+
+
+class ViewStatistics:
+    """Distinct values and value ranges of the arrests the dashboard shows.
+
+    Columns covered by ``sketch``, the load-time sketches of the selected
+    date range, are answered from it without scanning any rows. Other
+    columns, and every column when no sketch is given (summary and
+    out-of-core modes, or when exact statistics are requested), are computed
+    from ``df``.
+    """
+
+    def __init__(
+        self, df: pd.DataFrame, sketch: Optional[ColumnSketches] = None
+    ) -> None:
+        self.df = df
+        self.sketch = sketch
+
+    def values(self, col: str) -> List[str]:
+        """Return the sorted distinct values of a column."""
+        if self.sketch is not None and col in self.sketch.frequent:
+            return [str(value) for value in self.sketch.frequent[col].values()]
+        return present_values(self.df[col])
+
+    def distinct_count(self, col: str) -> int:
+        """Return the number of distinct values of a column."""
+        if self.sketch is not None and col in self.sketch.distinct:
+            return self.sketch.distinct[col].count()
+        return self.df[col].nunique()
+
+    def value_range(self, col: str) -> Optional[Tuple[Any, Any]]:
+        """Return the smallest and largest value of a column, if any."""
+        if self.sketch is not None and col in self.sketch.quantiles:
+            return self.sketch.value_range(col)
+        values = self.df[col].dropna()
+        return (values.min(), values.max()) if len(values) > 0 else None
+
+
+@st.cache_data
+def load_summary_data(
+    file_path: str, file_signature: Tuple[int, float] = (0, 0.0)
+) -> pd.DataFrame:
+    """Load the grouped-count summary table for summary-only mode.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the summary table written by ``download_dataset.py --summary``.
+    file_signature : Tuple[int, float]
+        Size and modification time of the file, from ``get_file_signature``.
+        Only used as part of the cache key.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per group, with the same column names as the full dataset
+        (``ARREST_BORO``, ``YEAR``, ``MONTH``, ``DAY_OF_WEEK``, ...) and the
+        number of arrests in each group in ``ARRESTS``.
 
-        # Validate and clean the data before returning
-        clean_df = validate_and_clean_data(df)
-        return clean_df
+    Purpose
+    -------
+    The summary table is a small fraction of the size of the raw data, so the
+    dashboard can start from it long before the full dataset is downloaded or
+    loaded. It stacks one small rollup per chart (``summary_rollups``), as one
+    table grouped by every column would have about one group per arrest.
+    ``ARREST_DATE`` is set to the first day of each group's month, or of its
+    year in the rollups without months, so date filtering works at month
+    resolution for the yearly and monthly charts and at year resolution for
+    the day-of-week and demographic charts.
+    """
+    try:
+        df = prepare_summary_table(pd.read_parquet(file_path))
+        st.info(
+            f"Loaded summary table: {len(df):,} groups covering {count_arrests(df):,} arrests"
+        )
+        return df
 
     except FileNotFoundError:
         st.error(f"Error: File '{file_path}' not found!")
         st.stop()
     except Exception as e:
-        st.error(f"Error loading dataset: {str(e)}")
+        st.error(f"Error loading summary table: {str(e)}")
         st.stop()
 
 
@@ -264,8 +2320,9 @@ def filter_and_sample_data(
     samples the filtered data to the requested size for performance optimization.
     """
     try:
-        # Create a copy to avoid modifying the original
-        filtered_df = df.copy()
+        # The filters below build new frames, so the original is never modified.
+        # A shallow copy avoids duplicating a shared, memory-mapped dataset.
+        filtered_df = df.copy(deep=False)
 
         # Apply date filtering if dates are provided
         if start_date is not None and end_date is not None:
@@ -278,6 +2335,10 @@ def filter_and_sample_data(
                 f"Filtered to date range: {start_date.strftime('%m/%d/%Y')} to {end_date.strftime('%m/%d/%Y')} - {len(filtered_df)} rows remaining"
             )
 
+        # The summary table holds counts, not individual arrests, so it is never sampled
+        if count_column in filtered_df.columns:
+            return filtered_df
+
         # Apply sampling AFTER date filtering
         if sample_size > 0 and len(filtered_df) > sample_size:
             filtered_df = filtered_df.sample(
@@ -296,13 +2357,101 @@ def filter_and_sample_data(
         return df
 
 
-def display_dataset_overview(df: pd.DataFrame) -> None:
+def describe_value_range(series: pd.Series) -> str:
+    """Summarize the values of a column in a few words.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column to summarize.
+
+    Returns
+    -------
+    str
+        The smallest and largest value of a numeric or date column, or the
+        number of distinct values of a text or categorical column.
+    """
+    is_date = pd.api.types.is_datetime64_any_dtype(series)
+    is_categorical = isinstance(series.dtype, pd.CategoricalDtype)
+    if is_categorical or not (is_date or pd.api.types.is_numeric_dtype(series)):
+        return f"{series.nunique():,} distinct values"
+    low, high = series.min(), series.max()
+    if pd.isna(low):
+        return "no values"
+    if is_date:
+        return f"{low:%m/%d/%Y} to {high:%m/%d/%Y}"
+    return f"{low:,.6g} to {high:,.6g}"
+
+
+def profile_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
+    """Compute the data quality figures shown in the "Dataset Information" tab.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The loaded dataset or sample shown by the dashboard.
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``columns``: one row per column with its data type, non-null and
+        missing counts, memory in MB and value range; ``missing_values``,
+        ``memory_mb`` and ``duplicate_rows`` for the whole frame.
+
+    Purpose
+    -------
+    Counting missing values, measuring memory and hashing every row to find
+    duplicates each scan the whole frame. ``main`` computes the profile once
+    whenever it builds a new sample and keeps it next to the sample in the
+    session, so reruns caused by unrelated widgets render the tab instantly.
+    """
+    missing = df.isna().sum()
+    memory = df.memory_usage(deep=True)
+    # Comparing the stored row hashes is much cheaper than hashing every row
+    if row_hash_column in df.columns:
+        duplicates = df[row_hash_column].duplicated()
+    else:
+        duplicates = df.duplicated()
+    columns = pd.DataFrame(
+        {
+            "Column": df.columns,
+            "Data Type": df.dtypes.astype(str),
+            "Non-Null Count": len(df) - missing,
+            "Missing": missing,
+            "Memory (MB)": (memory[df.columns] / 1024 / 1024).round(2),
+            "Range": [describe_value_range(df[col]) for col in df.columns],
+        }
+    )
+    return {
+        "columns": columns,
+        "missing_values": int(missing.sum()),
+        "memory_mb": memory.sum() / 1024 / 1024,
+        "duplicate_rows": int(duplicates.sum()),
+    }
+
+
+def display_dataset_overview(
+    df: pd.DataFrame,
+    map_df: Optional[pd.DataFrame] = None,
+    quality_profile: Optional[Dict[str, Any]] = None,
+    stats: Optional[ViewStatistics] = None,
+) -> None:
     """Display comprehensive overview of the dataset including basic statistics.
 
     Parameters
     ----------
     df : pd.DataFrame
         The NYPD arrests dataset to be displayed and analyzed.
+    map_df : Optional[pd.DataFrame]
+        Arrests plotted on the map when ``df`` holds grouped counts; see
+        ``create_geographic_analysis``.
+    quality_profile : Optional[Dict[str, Any]]
+        ``profile_data_quality(df)``, computed when ``df`` was built. Computed
+        here if not given.
+    stats : Optional[ViewStatistics]
+        Distinct values and date range of ``df`` for the overview cards and
+        filter options, from the load-time sketches. Computed from ``df`` if
+        not given.
 
     Returns
     -------
@@ -318,6 +2467,8 @@ def display_dataset_overview(df: pd.DataFrame) -> None:
     st.markdown(
         '<h1 class="main-header">NYPD Arrests Dashboard</h1>', unsafe_allow_html=True
     )
+    if stats is None:
+        stats = ViewStatistics(df)
 
     # Dataset overview metrics
     col1, col2 = st.columns(2)
@@ -326,7 +2477,7 @@ def display_dataset_overview(df: pd.DataFrame) -> None:
         st.markdown(
             f"""
         <div style="font-size: 1.5rem; font-weight: bold; color: white;">Total Arrests</div>
-        <div style="font-size: 2rem; font-weight: bold; color: #FF0000;">{len(df):,}</div>
+        <div style="font-size: 2rem; font-weight: bold; color: #FF0000;">{count_arrests(df):,}</div>
         """,
             unsafe_allow_html=True,
         )
@@ -334,7 +2485,7 @@ def display_dataset_overview(df: pd.DataFrame) -> None:
     with col2:
         # Check if ARREST_BORO exists
         if "ARREST_BORO" in df.columns:
-            borough_count = df["ARREST_BORO"].nunique()
+            borough_count = stats.distinct_count("ARREST_BORO")
         else:
             borough_count = "N/A"
 
@@ -349,9 +2500,8 @@ def display_dataset_overview(df: pd.DataFrame) -> None:
     # Boroughs list above the date range
     if "ARREST_BORO" in df.columns:
         try:
-            # Clean borough data and ensure it's string type
-            boroughs_raw = df["ARREST_BORO"].dropna().astype(str)
-            boroughs = sorted(boroughs_raw.unique())
+            # Borough codes as text, without missing values
+            boroughs = stats.values("ARREST_BORO")
             borough_names = {
                 "B": "Bronx",
                 "K": "Brooklyn",
@@ -381,10 +2531,9 @@ def display_dataset_overview(df: pd.DataFrame) -> None:
                 df["ARREST_DATE"] = pd.to_datetime(df["ARREST_DATE"], errors="coerce")
 
             # Check if we have valid dates after conversion
-            valid_dates = df["ARREST_DATE"].dropna()
-            if len(valid_dates) > 0:
-                min_date = valid_dates.min()
-                max_date = valid_dates.max()
+            date_bounds = stats.value_range("ARREST_DATE")
+            if date_bounds is not None:
+                min_date, max_date = date_bounds
                 if pd.notna(min_date) and pd.notna(max_date):
                     date_range = f"{min_date.strftime('%m/%d/%Y')} to {max_date.strftime('%m/%d/%Y')}"
                     days_diff = (max_date - min_date).days
@@ -416,13 +2565,13 @@ def display_dataset_overview(df: pd.DataFrame) -> None:
     )
 
     with tab1:
-        create_geographic_analysis(df)
+        create_geographic_analysis(df, map_df, stats)
 
     with tab2:
-        create_temporal_analysis(df)
+        create_temporal_analysis(df, stats)
 
     with tab3:
-        create_demographic_analysis(df)
+        create_demographic_analysis(df, stats)
 
     with tab4:
         # Dataset information
@@ -450,41 +2599,64 @@ def display_dataset_overview(df: pd.DataFrame) -> None:
             st.markdown("**First 5 rows:**")
             st.dataframe(df.head(), use_container_width=True)
 
+        # Full-frame scans are done once per sample, not on every rerun
+        if quality_profile is None:
+            quality_profile = profile_data_quality(df)
+
         with col2:
             st.markdown("**Data types:**")
-            dtype_info = pd.DataFrame(
-                {
-                    "Column": df.columns,
-                    "Data Type": df.dtypes.astype(str),
-                    "Non-Null Count": df.count(),
-                }
+            st.dataframe(
+                quality_profile["columns"], hide_index=True, use_container_width=True
             )
-            st.dataframe(dtype_info, use_container_width=True)
 
         # Data quality metrics
         st.markdown("### Data Quality Metrics For The Current Sample Size")
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            missing_data = df.isnull().sum().sum()
+            missing_data = quality_profile["missing_values"]
             st.metric("Missing Values", f"{missing_data:,}")
 
         with col2:
-            memory_usage = df.memory_usage(deep=True).sum() / 1024 / 1024
+            memory_usage = quality_profile["memory_mb"]
             st.metric("Memory Usage", f"{memory_usage:.1f} MB")
 
         with col3:
-            duplicate_rows = df.duplicated().sum()
+            duplicate_rows = quality_profile["duplicate_rows"]
             st.metric("Duplicate Rows", f"{duplicate_rows:,}")
 
+        # Checks run on every loaded row (see validate_and_clean_data)
+        validation_report = df.attrs.get("validation_report")
+        if validation_report:
+            st.markdown("### Validation Report")
+            st.caption(
+                "Checks run on the full dataset when it was loaded. Rows failing "
+                "a check are repaired as shown under Action, or kept as they are."
+            )
+            report_df = pd.DataFrame(validation_report).rename(
+                columns={
+                    "column": "Column",
+                    "check": "Check",
+                    "rule": "Rule",
+                    "failed_rows": "Failing Rows",
+                    "action": "Action",
+                }
+            )
+            st.dataframe(report_df, hide_index=True, use_container_width=True)
+
 
-def create_temporal_analysis(df: pd.DataFrame) -> None:
+def create_temporal_analysis(
+    df: pd.DataFrame, stats: Optional[ViewStatistics] = None
+) -> None:
     """Create temporal analysis visualizations showing arrest patterns over time.
 
     Parameters
     ----------
     df : pd.DataFrame
         The NYPD arrests dataset to analyze for temporal patterns.
+    stats : Optional[ViewStatistics]
+        Distinct values of ``df`` for the filter options. Computed from
+        ``df`` if not given.
 
     Returns
     -------
@@ -498,6 +2670,15 @@ def create_temporal_analysis(df: pd.DataFrame) -> None:
     and offense type selection, allowing users to analyze time patterns for
     specific subsets of the data.
     """
+    if stats is None:
+        stats = ViewStatistics(df)
+
+    # Derive the date parts of the analyzed rows (cached on the frame), next to
+    # the columns the filters and counts below read
+    df = df.date_parts.with_columns(
+        columns=["ARREST_BORO", "OFNS_DESC", count_column, rollup_column]
+    )
+
     # Add filters for borough and offense type
     st.markdown("### Filter Temporal Analysis")
     st.markdown("*Select specific boroughs and offense types to analyze time patterns*")
@@ -508,7 +2689,7 @@ def create_temporal_analysis(df: pd.DataFrame) -> None:
     with col1:
         try:
             # Create borough options with full names for display
-            borough_codes = sorted(df["ARREST_BORO"].dropna().astype(str).unique())
+            borough_codes = stats.values("ARREST_BORO")
             borough_names = {
                 "B": "Bronx",
                 "K": "Brooklyn",
@@ -548,7 +2729,7 @@ def create_temporal_analysis(df: pd.DataFrame) -> None:
     with col2:
         try:
             # Create offense options with "All Incidents" option
-            offense_options = sorted(df["OFNS_DESC"].dropna().astype(str).unique())
+            offense_options = stats.values("OFNS_DESC")
             offense_display_options = ["All Incidents"] + offense_options
 
             selected_offense_display = st.selectbox(
@@ -578,7 +2759,7 @@ def create_temporal_analysis(df: pd.DataFrame) -> None:
 
         # Show filter summary
         st.success(
-            f"Showing temporal patterns for {len(filtered_df):,} arrests from {len(selected_boroughs_filter)} borough(s) and {len(selected_offenses_filter)} offense type(s)"
+            f"Showing temporal patterns for {count_arrests(filtered_df):,} arrests from {len(selected_boroughs_filter)} borough(s) and {len(selected_offenses_filter)} offense type(s)"
         )
 
         # Use filtered data for all temporal visualizations
@@ -598,7 +2779,9 @@ def create_temporal_analysis(df: pd.DataFrame) -> None:
         ]
         if len(valid_years) > 0:
             yearly_arrests = (
-                valid_years.groupby("YEAR").size().reset_index(name="Arrests")
+                arrest_counts(valid_years, "YEAR")
+                .sort_index()
+                .reset_index(name="Arrests")
             )
 
             fig_yearly = px.line(
@@ -632,7 +2815,9 @@ def create_temporal_analysis(df: pd.DataFrame) -> None:
             ]
             if len(valid_months) > 0:
                 monthly_arrests = (
-                    valid_months.groupby("MONTH").size().reset_index(name="Arrests")
+                    arrest_counts(valid_months, "MONTH")
+                    .sort_index()
+                    .reset_index(name="Arrests")
                 )
                 monthly_arrests["Month_Name"] = monthly_arrests["MONTH"].map(
                     {
@@ -709,8 +2894,8 @@ def create_temporal_analysis(df: pd.DataFrame) -> None:
                 & (df_to_analyze["DAY_OF_WEEK"] != "Unknown")
             ]
             if len(valid_days) > 0:
-                dow_arrests = (
-                    valid_days.groupby("DAY_OF_WEEK").size().reset_index(name="Arrests")
+                dow_arrests = arrest_counts(valid_days, "DAY_OF_WEEK").reset_index(
+                    name="Arrests"
                 )
                 dow_order = [
                     "Monday",
@@ -771,13 +2956,23 @@ def create_temporal_analysis(df: pd.DataFrame) -> None:
             st.error(f"Error creating day of week patterns: {str(e)}")
 
 
-def create_geographic_analysis(df: pd.DataFrame) -> None:
+def create_geographic_analysis(
+    df: pd.DataFrame,
+    map_df: Optional[pd.DataFrame] = None,
+    stats: Optional[ViewStatistics] = None,
+) -> None:
     """Create geographic analysis visualizations showing arrest patterns by location.
 
     Parameters
     ----------
     df : pd.DataFrame
         The NYPD arrests dataset to analyze for geographic patterns.
+    map_df : Optional[pd.DataFrame]
+        Arrests plotted on the map, if not ``df`` itself: the map sample of an
+        out-of-core load, whose ``df`` only holds grouped counts.
+    stats : Optional[ViewStatistics]
+        Distinct values and counts of ``df`` for the filter options and the
+        pie chart summary. Computed from ``df`` if not given.
 
     Returns
     -------
@@ -792,8 +2987,15 @@ def create_geographic_analysis(df: pd.DataFrame) -> None:
     all data or sampled data for performance optimization.
     """
 
+    # The map plots individual arrests
+    if map_df is None:
+        map_df = df
+    if stats is None:
+        stats = ViewStatistics(df)
+    map_stats = stats if map_df is df else ViewStatistics(map_df)
+
     # Geographic coordinates visualization (if coordinates are available)
-    if "latitude" in df.columns and "longitude" in df.columns:
+    if "latitude" in map_df.columns and "longitude" in map_df.columns:
         st.markdown("### Map View")
         st.markdown(
             "*Customize the map view by selecting specific boroughs and offense types*"
@@ -805,7 +3007,7 @@ def create_geographic_analysis(df: pd.DataFrame) -> None:
         with col1:
             try:
                 # Create borough options with full names for display
-                borough_codes = sorted(df["ARREST_BORO"].dropna().astype(str).unique())
+                borough_codes = map_stats.values("ARREST_BORO")
                 borough_names = {
                     "B": "Bronx",
                     "K": "Brooklyn",
@@ -845,7 +3047,7 @@ def create_geographic_analysis(df: pd.DataFrame) -> None:
         with col2:
             try:
                 # Create offense options with "All Incidents" option
-                offense_options = sorted(df["OFNS_DESC"].dropna().astype(str).unique())
+                offense_options = map_stats.values("OFNS_DESC")
                 offense_display_options = ["All Incidents"] + offense_options
 
                 selected_offense_display = st.selectbox(
@@ -889,17 +3091,18 @@ def create_geographic_analysis(df: pd.DataFrame) -> None:
         # Filter the data based on selections only when button is clicked
         if filter_button and selected_boroughs_filter and selected_offenses_filter:
             with st.spinner("Filtering map data..."):
-                filtered_df = df[
-                    (df["ARREST_BORO"].isin(selected_boroughs_filter))
-                    & (df["OFNS_DESC"].isin(selected_offenses_filter))
+                # Start from the arrests whose coordinates passed the checks
+                # at load time
+                mappable_df = mappable_rows(map_df)
+                filtered_df = mappable_df[
+                    (mappable_df["ARREST_BORO"].isin(selected_boroughs_filter))
+                    & (mappable_df["OFNS_DESC"].isin(selected_offenses_filter))
                 ]
 
                 # Handle data sampling based on user preference
                 if show_all_data:
                     # Show all data with coordinates
-                    filtered_sample_df = filtered_df.dropna(
-                        subset=["latitude", "longitude"]
-                    )
+                    filtered_sample_df = filtered_df
                     if len(filtered_sample_df) > 100000:
                         st.warning(
                             "`Map View: Showing all data may be slow with large datasets. Consider unchecking 'Show all data' for better performance."
@@ -914,9 +3117,9 @@ def create_geographic_analysis(df: pd.DataFrame) -> None:
                         )
                         else 10000
                     )
-                    filtered_sample_df = filtered_df.dropna(
-                        subset=["latitude", "longitude"]
-                    ).sample(n=min(max_points, len(filtered_df)))
+                    filtered_sample_df = filtered_df.sample(
+                        n=min(max_points, len(filtered_df))
+                    )
 
                 if len(filtered_sample_df) > 0:
                     # Create filtered map with full borough names
@@ -969,18 +3172,18 @@ def create_geographic_analysis(df: pd.DataFrame) -> None:
     pie_chart_data = df
 
     # Count actual boroughs and offense types in the data
-    borough_count = pie_chart_data["ARREST_BORO"].nunique()
-    offense_count = pie_chart_data["OFNS_DESC"].nunique()
+    borough_count = stats.distinct_count("ARREST_BORO")
+    offense_count = stats.distinct_count("OFNS_DESC")
 
     chart_title = (
         "Arrest Distribution by Borough - Per Capita Rates (per 100,000 residents)"
     )
     st.success(
-        f"Pie Chart: Showing {len(pie_chart_data):,} arrests from {borough_count} borough(s) and {offense_count} offense type(s)"
+        f"Pie Chart: Showing {count_arrests(pie_chart_data):,} arrests from {borough_count} borough(s) and {offense_count} offense type(s)"
     )
 
     # Create borough distribution from the selected dataset
-    boro_arrests = pie_chart_data["ARREST_BORO"].value_counts().reset_index()
+    boro_arrests = arrest_counts(pie_chart_data, "ARREST_BORO").reset_index()
     boro_arrests.columns = ["Borough", "Arrests"]
 
     # Map borough codes to full names
@@ -1059,13 +3262,18 @@ def create_geographic_analysis(df: pd.DataFrame) -> None:
     st.dataframe(display_df, use_container_width=True)
 
 
-def create_demographic_analysis(df: pd.DataFrame) -> None:
+def create_demographic_analysis(
+    df: pd.DataFrame, stats: Optional[ViewStatistics] = None
+) -> None:
     """Create demographic analysis visualizations showing arrest patterns by demographics.
 
     Parameters
     ----------
     df : pd.DataFrame
         The NYPD arrests dataset to analyze for demographic patterns.
+    stats : Optional[ViewStatistics]
+        Distinct values of ``df`` for the filter options. Computed from
+        ``df`` if not given.
 
     Returns
     -------
@@ -1079,6 +3287,9 @@ def create_demographic_analysis(df: pd.DataFrame) -> None:
     borough and offense type selection, allowing users to analyze demographic
     patterns for specific subsets of the data.
     """
+    if stats is None:
+        stats = ViewStatistics(df)
+
     # Add filters for borough and offense type
     st.markdown("### Filter Demographics")
     st.markdown(
@@ -1091,7 +3302,7 @@ def create_demographic_analysis(df: pd.DataFrame) -> None:
     with col1:
         try:
             # Create borough options with full names for display
-            borough_codes = sorted(df["ARREST_BORO"].dropna().astype(str).unique())
+            borough_codes = stats.values("ARREST_BORO")
             borough_names = {
                 "B": "Bronx",
                 "K": "Brooklyn",
@@ -1131,7 +3342,7 @@ def create_demographic_analysis(df: pd.DataFrame) -> None:
     with col2:
         try:
             # Create offense options with "All Incidents" option
-            offense_options = sorted(df["OFNS_DESC"].dropna().astype(str).unique())
+            offense_options = stats.values("OFNS_DESC")
             offense_display_options = ["All Incidents"] + offense_options
 
             selected_offense_display = st.selectbox(
@@ -1161,7 +3372,7 @@ def create_demographic_analysis(df: pd.DataFrame) -> None:
 
         # Show filter summary
         st.success(
-            f"Showing demographics for {len(filtered_df):,} arrests from {len(selected_boroughs_filter)} borough(s) and {len(selected_offenses_filter)} offense type(s)"
+            f"Showing demographics for {count_arrests(filtered_df):,} arrests from {len(selected_boroughs_filter)} borough(s) and {len(selected_offenses_filter)} offense type(s)"
         )
 
         # Use filtered data for all demographic visualizations
@@ -1174,7 +3385,7 @@ def create_demographic_analysis(df: pd.DataFrame) -> None:
     col1, col2 = st.columns(2)
 
     with col1:
-        age_arrests = df_to_analyze["AGE_GROUP_CLEAN"].value_counts().reset_index()
+        age_arrests = arrest_counts(df_to_analyze, "AGE_GROUP_CLEAN").reset_index()
         age_arrests.columns = ["Age_Group", "Arrests"]
 
         # Define distinct colors for age groups
@@ -1217,7 +3428,7 @@ def create_demographic_analysis(df: pd.DataFrame) -> None:
         st.plotly_chart(fig_age, use_container_width=True)
 
     with col2:
-        gender_arrests = df_to_analyze["PERP_SEX"].value_counts().reset_index()
+        gender_arrests = arrest_counts(df_to_analyze, "PERP_SEX").reset_index()
         gender_arrests.columns = ["Gender", "Arrests"]
 
         # Define gender colors
@@ -1241,7 +3452,7 @@ def create_demographic_analysis(df: pd.DataFrame) -> None:
         st.plotly_chart(fig_gender, use_container_width=True)
 
     # Race analysis
-    race_arrests = df_to_analyze["PERP_RACE"].value_counts().reset_index()
+    race_arrests = arrest_counts(df_to_analyze, "PERP_RACE").reset_index()
     race_arrests.columns = ["Race", "Arrests"]
 
     # Show top 10 races
@@ -1367,6 +3578,81 @@ def main() -> None:
             help="Number of rows to sample from the date-filtered data",
         )
 
+        # CSV parser used when the dataset is read from CSV
+        csv_engine = st.sidebar.selectbox(
+            "CSV Engine:",
+            options=["pyarrow", "pandas"],
+            format_func=lambda engine: {
+                "pyarrow": "Arrow (multi-threaded)",
+                "pandas": "pandas",
+            }[engine],
+            key="csv_engine_select",
+            help="Parser used to read the CSV dataset. Arrow parses on all cores.",
+        )
+
+        # Lean mode keeps a single copy of every column the dashboard reads
+        lean_mode = st.sidebar.checkbox(
+            "Lean memory mode",
+            value=True,
+            key="lean_mode_checkbox",
+            help="Rename columns in place and drop the columns the dashboard never "
+            "reads, instead of keeping the original columns next to the renamed ones.",
+        )
+
+        # Progressive loading renders from the first batch of the CSV
+        progressive_loading = st.sidebar.checkbox(
+            "Progressive loading",
+            value=True,
+            key="progressive_loading_checkbox",
+            help="Load the CSV in batches in the background and show the charts "
+            "from the first batch, refining them as the rest arrives.",
+        )
+
+        # Shared mode maps one on-disk copy of the dataset into every process
+        shared_dataset = st.sidebar.checkbox(
+            "Shared memory-mapped dataset",
+            value=False,
+            key="shared_dataset_checkbox",
+            help="Write the processed dataset once as an uncompressed Arrow file in "
+            f"{cache_directory}/ and memory-map it, so Streamlit processes serving "
+            "the dashboard share one copy in memory instead of one each.",
+        )
+
+        # Out-of-core mode aggregates the CSV batch by batch instead of loading it
+        out_of_core = st.sidebar.checkbox(
+            "Out-of-core mode",
+            value=False,
+            key="out_of_core_checkbox",
+            help="Stream the CSV in batches and keep only grouped arrest counts and "
+            f"a random sample of {map_sample_size:,} arrests for the map, so files "
+            "larger than memory can be analyzed. Dates are filtered by month (by year "
+            "for the day-of-week and demographic charts).",
+        )
+
+        # Summary-only mode starts from grouped counts instead of the raw data
+        summary_available = os.path.exists(summary_file)
+        csv_file = next((f for f in data_files if os.path.exists(f)), data_file)
+        raw_available = os.path.exists(csv_file) or os.path.isdir(parquet_dataset)
+        summary_only = st.sidebar.checkbox(
+            "Summary-only mode",
+            value=summary_available and not raw_available,
+            disabled=not summary_available,
+            key="summary_only_checkbox",
+            help="Start from the grouped-count summary table (download_dataset.py --summary). "
+            "Loads almost instantly; the map is not available and dates are filtered by month "
+            "(by year for the day-of-week and demographic charts).",
+        )
+
+        # Overview cards and filter options come from load-time sketches
+        exact_statistics = st.sidebar.checkbox(
+            "Exact statistics",
+            value=False,
+            key="exact_statistics_checkbox",
+            help="Compute distinct values and the date range from the shown rows "
+            "instead of the sketches built per arrest year when the data was "
+            "loaded. Slower on large samples.",
+        )
+
         if st.sidebar.button("Load Data", key="load_data_button"):
             try:
                 # Validate date range
@@ -1378,24 +3664,178 @@ def main() -> None:
                 start_date = datetime.combine(start_date_str, datetime.min.time())
                 end_date = datetime.combine(end_date_str, datetime.max.time())
 
-                # Load full dataset only once (cached)
-                if "full_df" not in st.session_state:
-                    st.session_state.full_df = load_full_nypd_data(
-                        "nypd_arrests_dataset.csv"
+                # The Parquet dataset only loads the years in the selected range
+                if summary_only:
+                    source_file = summary_file
+                    years = None
+                elif out_of_core:
+                    source_file = csv_file
+                    years = None
+                elif os.path.isdir(parquet_dataset):
+                    source_file = parquet_dataset
+                    years = (start_date.year, end_date.year)
+                else:
+                    source_file = csv_file
+                    years = None
+
+                # A download manifest that still matches the file identifies it
+                # by content, and its column statistics spare re-validation
+                file_signature = get_file_signature(source_file)
+                column_stats = None
+                manifest = load_manifest(source_file)
+                if source_file == csv_file and manifest_matches(source_file, manifest):
+                    file_signature = (manifest["bytes"], manifest["sha256"])
+                    column_stats = manifest["columns"]
+
+                # Load full dataset only once (cached), or again if the file or
+                # a loading option changed
+                load_key = (
+                    source_file,
+                    file_signature,
+                    years,
+                    csv_engine,
+                    lean_mode,
+                    shared_dataset,
+                    out_of_core,
+                )
+                # The CSV is loaded in the background unless the disk cache has
+                # it, or has it without the rows appended since
+                progressive_load = (
+                    progressive_loading
+                    and source_file == csv_file
+                    and not (summary_only or out_of_core or shared_dataset)
+                    and not os.path.exists(
+                        processed_cache_path(*load_key[:3], lean_mode)
                     )
+                    and appendable_cache_entry(source_file, lean_mode) is None
+                )
+                # A load with other options replaces one running in the background
+                if (
+                    "loader" in st.session_state
+                    and st.session_state.loader_key != load_key
+                ):
+                    st.session_state.loader.cancel()
+                    del st.session_state.loader
+                if (
+                    "full_df" not in st.session_state
+                    or st.session_state.get("full_df_key") != load_key
+                ):
+                    st.session_state.full_map_df = None
+                    st.session_state.load_profile = None
+                    st.session_state.sketches = None
+                    if summary_only:
+                        st.session_state.full_df = load_summary_data(*load_key[:2])
+                    elif progressive_load:
+                        # Rendered from the rows loaded so far until done, below
+                        if "loader" not in st.session_state:
+                            st.session_state.loader = BackgroundLoader(
+                                source_file,
+                                column_stats,
+                                csv_engine,
+                                lean_mode,
+                                manifest["rows"] if column_stats else None,
+                            )
+                            st.session_state.loader_key = load_key
+                        st.session_state.pop("full_df", None)
+                    elif out_of_core:
+                        st.session_state.full_df, st.session_state.full_map_df = (
+                            load_chunked_nypd_data(*load_key[:2], csv_engine)
+                        )
+                    elif shared_dataset:
+                        st.session_state.full_df = load_shared_nypd_data(
+                            *load_key[:3], column_stats, csv_engine, lean_mode
+                        )
+                    else:
+                        profile = LoadProfile(source_file)
+                        st.session_state.full_df = load_full_nypd_data(
+                            *load_key[:3], column_stats, csv_engine, lean_mode, profile
+                        )
+                        st.session_state.load_profile = profile
+                    # Progressive loads sketch the dataset once it has finished
+                    if not (summary_only or out_of_core or progressive_load):
+                        st.session_state.sketches = load_dataset_sketches(
+                            load_key, st.session_state.full_df
+                        )
+                    st.session_state.full_df_key = load_key
 
                 # Apply filters and sampling to the cached full dataset
-                st.session_state.df = filter_and_sample_data(
-                    st.session_state.full_df, sample_size, start_date, end_date
-                )
+                st.session_state.data_view = (sample_size, start_date, end_date)
+                if "loader" not in st.session_state:
+                    st.session_state.df = filter_and_sample_data(
+                        st.session_state.full_df, sample_size, start_date, end_date
+                    )
+                    st.session_state.quality_profile = profile_data_quality(
+                        st.session_state.df
+                    )
+                    st.session_state.view_sketch = sketch_view(
+                        st.session_state.get("sketches"), start_date, end_date
+                    )
+                # The map sample of an out-of-core load is filtered to the same dates
+                map_df = st.session_state.full_map_df
+                if map_df is not None:
+                    map_df = map_df[map_df["ARREST_DATE"].between(start_date, end_date)]
+                st.session_state.map_df = map_df
 
                 # Store the filtered date range for display purposes
                 st.session_state.filtered_date_range = f"{start_date.strftime('%m/%d/%Y')} to {end_date.strftime('%m/%d/%Y')}"
-                st.success("Data loaded successfully!")
+                if "loader" not in st.session_state:
+                    st.success("Data loaded successfully!")
             except Exception as e:
                 st.error(f"Error loading data: {str(e)}")
                 st.stop()
 
+        # While a progressive load runs, show the rows loaded so far
+        loader = st.session_state.get("loader")
+        if loader is not None:
+            # Read the rows after checking for the end, so none are missed
+            done = loader.done
+            frame = loader.frame
+            if done:
+                del st.session_state.loader
+                if loader.error is not None or frame is None:
+                    st.error(f"Error loading dataset: {loader.error or 'no rows'}")
+                    st.stop()
+                st.session_state.full_df = frame
+                st.session_state.load_profile = loader.profile
+                st.session_state.sketches = loader.sketches
+                save_processed_cache(
+                    frame,
+                    processed_cache_path(*st.session_state.loader_key[:3], loader.lean),
+                )
+                st.success(f"Loaded full dataset: {len(frame):,} rows")
+            else:
+                rows = 0 if frame is None else len(frame)
+                total = loader.total_rows
+                if total:
+                    approximately = "" if loader.total_exact else "~"
+                    st.sidebar.progress(
+                        min(rows / total, 1.0),
+                        text=f"{rows:,} of {approximately}{total:,} rows loaded",
+                    )
+                else:
+                    st.sidebar.progress(0.0, text=f"{rows:,} rows loaded")
+                if frame is None:
+                    # Wait for the first batch
+                    time.sleep(progress_refresh_seconds / 5)
+                    st.rerun()
+            st.session_state.df = filter_and_sample_data(
+                frame, *st.session_state.data_view
+            )
+            st.session_state.quality_profile = profile_data_quality(st.session_state.df)
+            st.session_state.view_sketch = sketch_view(
+                loader.sketches, *st.session_state.data_view[1:]
+            )
+
+        # Time, throughput and memory of each stage of the last load
+        profile = st.session_state.get("load_profile")
+        if profile is not None:
+            with st.sidebar.expander("Load profile", expanded=False):
+                if profile.stages:
+                    st.dataframe(profile.to_frame(), hide_index=True)
+                    st.caption(f"Total: {profile.total_seconds:.2f} s")
+                else:
+                    st.caption("Served from the in-memory cache; nothing was loaded.")
+
         # Check if data is loaded
         if "df" not in st.session_state:
             st.info("Please load the dataset using the sidebar controls.")
@@ -1404,7 +3844,19 @@ def main() -> None:
         df = st.session_state.df
 
         # Create dashboard sections
-        display_dataset_overview(df)
+        # Distinct values and date range from the sketches, unless exact is asked
+        view_sketch = None if exact_statistics else st.session_state.get("view_sketch")
+        display_dataset_overview(
+            df,
+            st.session_state.get("map_df"),
+            st.session_state.get("quality_profile"),
+            ViewStatistics(df, view_sketch),
+        )
+
+        # Refresh with the rows loaded in the meantime
+        if "loader" in st.session_state:
+            time.sleep(progress_refresh_seconds)
+            st.rerun()
 
     except Exception as e:
         st.error(f"An error occurred: {str(e)}")
@@ -0,0 +1,181 @@
+# Import libraries.
+from typing import Any, Dict, List, Optional
+
+# Define the storage type of each raw column of the NYPD arrests export (dataset 8h9b-rp9u).
+# "category" columns have few distinct values and are dictionary encoded.
+column_types = {
+    "arrest_key": "int64",
+    "arrest_date": "datetime",
+    "pd_cd": "float32",
+    "pd_desc": "category",
+    "ky_cd": "float32",
+    "ofns_desc": "category",
+    "law_code": "category",
+    "law_cat_cd": "category",
+    "arrest_boro": "category",
+    "arrest_precinct": "float32",
+    "jurisdiction_code": "float32",
+    "age_group": "category",
+    "perp_sex": "category",
+    "perp_race": "category",
+    "x_coord_cd": "float32",
+    "y_coord_cd": "float32",
+    "latitude": "float32",
+    "longitude": "float32",
+}
+
+# Define the format of arrest_date values returned by the API, e.g. 2009-08-01T00:00:00.000.
+date_format = "%Y-%m-%dT%H:%M:%S.%f"
+
+# Map the raw column names the dashboard reads to the names it uses internally.
+column_mapping = {
+    "arrest_date": "ARREST_DATE",
+    "arrest_boro": "ARREST_BORO",
+    "age_group": "AGE_GROUP",
+    "perp_sex": "PERP_SEX",
+    "perp_race": "PERP_RACE",
+    "ofns_desc": "OFNS_DESC",
+    "law_cat_cd": "LAW_CAT_CD",
+    "jurisdiction_code": "JURISDICTION_CODE",
+    "latitude": "latitude",
+    "longitude": "longitude",
+}
+
+# Define the checks validate_and_clean_data runs on the dashboard columns after loading.
+# "category" columns must be categorical without missing values and, if "values" is
+# given, hold only those codes (or "Unknown"). "number" columns must be numeric and,
+# if "range" is given, lie within it; the ranges are the bounding box of the five boroughs.
+validation_rules = {
+    "ARREST_BORO": {"kind": "category", "values": ["B", "K", "M", "Q", "S"]},
+    "PERP_SEX": {"kind": "category", "values": ["F", "M", "U"]},
+    "LAW_CAT_CD": {"kind": "category", "values": ["F", "M", "V", "I", "9"]},
+    "OFNS_DESC": {"kind": "category"},
+    "PERP_RACE": {"kind": "category"},
+    "AGE_GROUP": {
+        "kind": "category",
+        "values": ["<18", "18-24", "25-44", "45-64", "65+"],
+    },
+    "latitude": {"kind": "number", "range": (40.47, 40.93)},
+    "longitude": {"kind": "number", "range": (-74.27, -73.68)},
+}
+
+# Define the bounding box of each borough: (latitude range, longitude range), with a
+# margin of about 1 km. Coordinates outside their arrest borough's box are not mapped.
+borough_bounds = {
+    "B": ((40.78, 40.93), (-73.94, -73.75)),
+    "K": ((40.56, 40.75), (-74.05, -73.82)),
+    "M": ((40.67, 40.89), (-74.05, -73.90)),
+    "Q": ((40.53, 40.81), (-73.97, -73.69)),
+    "S": ((40.49, 40.66), (-74.26, -74.04)),
+}
+
+# Define the raw columns to download when only the dashboard needs the data.
+# arrest_key is kept so that delta syncs can tell new rows from stored ones.
+dashboard_columns = ["arrest_key"] + list(column_mapping)
+
+# Define the columns of the grouped-count summary table: output column name to the SoQL
+# expression it groups by. date_extract_dow counts days from Sunday (0) to Saturday (6).
+summary_groups = {
+    "year": "date_extract_y(arrest_date)",
+    "month": "date_extract_m(arrest_date)",
+    "day_of_week": "date_extract_dow(arrest_date)",
+    "arrest_boro": "arrest_boro",
+    "ofns_desc": "ofns_desc",
+    "age_group": "age_group",
+    "perp_sex": "perp_sex",
+    "perp_race": "perp_race",
+}
+# Define the rollups stacked in the summary table, one per dashboard chart: the columns of
+# summary_groups each one groups by. All keep the year, borough and offense the date and
+# filter controls select on. The day of the week and each demographic column get their own
+# rollup, as crossing them would give about one group per arrest.
+summary_rollups = {
+    "month": ["year", "month", "arrest_boro", "ofns_desc"],
+    "day_of_week": ["year", "day_of_week", "arrest_boro", "ofns_desc"],
+    "age_group": ["year", "arrest_boro", "ofns_desc", "age_group"],
+    "perp_sex": ["year", "arrest_boro", "ofns_desc", "perp_sex"],
+    "perp_race": ["year", "arrest_boro", "ofns_desc", "perp_race"],
+}
+# Define the name of the summary table column naming the rollup of each row.
+summary_rollup_column = "rollup"
+# Define the name of the arrest count column of the summary table.
+summary_count_column = "arrests"
+
+# Define the name of the partition column of the Parquet dataset.
+partition_column = "arrest_year"
+
+# Define the codecs the raw CSV can be stored with: file name suffix and leading magic bytes.
+compression_suffixes = {"gzip": ".gz", "zstd": ".zst"}
+compression_magic = {"gzip": b"\x1f\x8b", "zstd": b"\x28\xb5\x2f\xfd"}
+
+
+def detect_compression(file_path: str) -> Optional[str]:
+    """Detect how a raw CSV file is compressed from its first bytes.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the CSV file.
+
+    Returns
+    -------
+    Optional[str]
+        ``"gzip"`` or ``"zstd"``, usable as the ``compression`` argument of
+        ``pd.read_csv``, or ``None`` for an uncompressed file.
+
+    Purpose
+    -------
+    The magic bytes are checked instead of the file extension, so a compressed
+    file is still read correctly after being renamed.
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(4)
+    for codec, magic in compression_magic.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def csv_column_types(columns: Optional[List[str]] = None) -> Dict[str, str]:
+    """Return ``column_types`` as dtypes for ``pd.read_csv``.
+
+    Parameters
+    ----------
+    columns : Optional[List[str]]
+        Raw columns to include. ``None`` includes every column.
+
+    Returns
+    -------
+    Dict[str, str]
+        Column name to pandas dtype. Dates are read as categorical text, as
+        there are only a few thousand distinct days, and parsed after loading.
+    """
+    return {
+        column: "category" if kind == "datetime" else kind
+        for column, kind in column_types.items()
+        if columns is None or column in columns
+    }
+
+
+def arrow_column_types() -> Dict[str, Any]:
+    """Return ``column_types`` as pyarrow data types.
+
+    Parameters
+    ----------
+    None
+        This function takes no parameters.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Column name to ``pyarrow.DataType``, for ``pyarrow.csv.ConvertOptions``.
+    """
+    import pyarrow as pa
+
+    arrow_types = {
+        "int64": pa.int64(),
+        "float32": pa.float32(),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "datetime": pa.timestamp("ms"),
+    }
+    return {column: arrow_types[kind] for column, kind in column_types.items()}
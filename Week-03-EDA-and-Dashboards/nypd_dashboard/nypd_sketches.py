@@ -0,0 +1,297 @@
+# Import libraries.
+import numpy as np
+import pandas as pd
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Define the number of HyperLogLog registers as a power of two (4096, about 1.6% error).
+hll_precision = 12
+# Define how many distinct values a frequent-value summary counts exactly.
+frequent_values_capacity = 256
+
+
+def bit_length(values: np.ndarray) -> np.ndarray:
+    """Return the number of significant bits of each ``uint64`` value.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Unsigned 64-bit integers.
+
+    Returns
+    -------
+    np.ndarray
+        Bit length per value, 0 for 0. Each 32-bit half is converted to a
+        float, which holds it exactly, and measured with ``np.frexp``.
+    """
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+class HyperLogLog:
+    """HyperLogLog estimate of the number of distinct values of a column.
+
+    Each hash is routed to one of ``2**precision`` registers by its leading
+    bits, and the register keeps the longest run of zero bits seen after
+    them. Sketches merge by taking the larger register, so the sketches of
+    partitions combine into the sketch of their union. The relative error is
+    about ``1.04 / sqrt(2**precision)``; small counts are exact in practice.
+    """
+
+    def __init__(self, precision: int = hll_precision) -> None:
+        self.precision = precision
+        self.registers = np.zeros(2**precision, dtype=np.uint8)
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add the 64-bit hashes of a batch of values."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        suffix_bits = 64 - self.precision
+        index = (hashes >> np.uint64(suffix_bits)).astype(np.intp)
+        suffix = hashes & np.uint64((1 << suffix_bits) - 1)
+        rank = (suffix_bits + 1 - bit_length(suffix)).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Add the values counted by another sketch of the same precision."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        """Return the estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        empty = int(np.count_nonzero(self.registers == 0))
+        # Linear counting is more accurate while many registers are empty
+        if estimate <= 2.5 * m and empty:
+            estimate = m * np.log(m / empty)
+        return int(round(estimate))
+
+
+class FrequentValues:
+    """Misra-Gries summary of the most frequent values of a column.
+
+    At most ``capacity`` values are counted. When more are seen, every count
+    is lowered by the count of the first value over capacity and values that
+    reach zero are dropped, so a count is low by at most
+    ``rows / (capacity + 1)``. Columns with up to ``capacity`` distinct values,
+    like the dashboard's categorical columns, are counted exactly. Summaries
+    of partitions merge the same way.
+    """
+
+    def __init__(self, capacity: int = frequent_values_capacity) -> None:
+        self.capacity = capacity
+        self.counts: Dict[Any, int] = {}
+
+    def add_counts(self, counts: Dict[Any, int]) -> None:
+        """Add the number of rows of each value."""
+        for value, count in counts.items():
+            self.counts[value] = self.counts.get(value, 0) + int(count)
+        if len(self.counts) > self.capacity:
+            ranked = sorted(self.counts.values(), reverse=True)
+            cut = ranked[self.capacity]
+            self.counts = {
+                value: count - cut
+                for value, count in self.counts.items()
+                if count > cut
+            }
+
+    def add(self, series: pd.Series) -> None:
+        """Add the values of a batch; missing values are not counted."""
+        counts = series.value_counts()
+        self.add_counts(counts[counts > 0].to_dict())
+
+    def merge(self, other: "FrequentValues") -> None:
+        """Add the values counted by another summary."""
+        self.add_counts(other.counts)
+
+    def values(self) -> List[Any]:
+        """Return the values counted, in sorted order."""
+        return sorted(self.counts)
+
+
+class QuantileSketch:
+    """Mergeable histogram of a numeric column at a fixed resolution.
+
+    Values are counted per bin of width ``resolution``, so every quantile is
+    within one resolution of the exact one, whatever the number of rows, and
+    sketches of partitions merge by adding their bin counts. The smallest and
+    largest values are kept exactly, overall and per bin, so a sketch
+    restricted to a range of bins knows its own extremes.
+    """
+
+    def __init__(self, resolution: float) -> None:
+        self.resolution = resolution
+        self.bins = np.empty(0, dtype=np.int64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.lows = np.empty(0, dtype=np.float64)
+        self.highs = np.empty(0, dtype=np.float64)
+        self.min = np.inf
+        self.max = -np.inf
+
+    def _add_bins(
+        self, bins: np.ndarray, counts: np.ndarray, lows: np.ndarray, highs: np.ndarray
+    ) -> None:
+        bins, inverse = np.unique(
+            np.concatenate([self.bins, bins]), return_inverse=True
+        )
+        self.counts = np.bincount(
+            inverse, weights=np.concatenate([self.counts, counts]), minlength=len(bins)
+        ).astype(np.int64)
+        merged_lows = np.full(len(bins), np.inf)
+        np.minimum.at(merged_lows, inverse, np.concatenate([self.lows, lows]))
+        merged_highs = np.full(len(bins), -np.inf)
+        np.maximum.at(merged_highs, inverse, np.concatenate([self.highs, highs]))
+        self.bins, self.lows, self.highs = bins, merged_lows, merged_highs
+
+    def add(self, values: np.ndarray) -> None:
+        """Add a batch of values; NaN values are skipped."""
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        bins, inverse, counts = np.unique(
+            np.floor(values / self.resolution).astype(np.int64),
+            return_inverse=True,
+            return_counts=True,
+        )
+        lows = np.full(len(bins), np.inf)
+        np.minimum.at(lows, inverse, values)
+        highs = np.full(len(bins), -np.inf)
+        np.maximum.at(highs, inverse, values)
+        self._add_bins(bins, counts, lows, highs)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the values counted by another sketch of the same resolution."""
+        self._add_bins(other.bins, other.counts, other.lows, other.highs)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the value below which a share ``q`` of the values lies."""
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        position = np.searchsorted(np.cumsum(self.counts), q * self.count)
+        middle = (self.bins[position] + 0.5) * self.resolution
+        return min(max(middle, self.min), self.max)
+
+    def restrict(self, low: float, high: float) -> "QuantileSketch":
+        """Return the sketch of the values between ``low`` and ``high``."""
+        keep = (self.bins >= np.floor(low / self.resolution)) & (
+            self.bins <= np.floor(high / self.resolution)
+        )
+        restricted = QuantileSketch(self.resolution)
+        restricted.bins, restricted.counts = self.bins[keep], self.counts[keep]
+        restricted.lows, restricted.highs = self.lows[keep], self.highs[keep]
+        if restricted.count:
+            # The kept bins' own extremes, within the range asked for
+            restricted.min = max(low, float(restricted.lows[0]))
+            restricted.max = min(high, float(restricted.highs[-1]))
+        return restricted
+
+
+class ColumnSketches:
+    """Sketches of the columns of one partition of a dataset.
+
+    Parameters
+    ----------
+    categories : Iterable[str]
+        Columns whose distinct values are sketched, with a ``HyperLogLog``
+        for their number and a ``FrequentValues`` summary for the values.
+    ranges : Dict[str, float]
+        Columns whose value distribution is sketched with a
+        ``QuantileSketch``, and its resolution. Date columns are sketched in
+        milliseconds since the epoch.
+    """
+
+    def __init__(self, categories: Iterable[str], ranges: Dict[str, float]) -> None:
+        self.rows = 0
+        self.distinct = {col: HyperLogLog() for col in categories}
+        self.frequent = {col: FrequentValues() for col in categories}
+        self.quantiles = {col: QuantileSketch(res) for col, res in ranges.items()}
+        self.dates: set = set()
+
+    def add(self, df: pd.DataFrame) -> None:
+        """Add the rows of a frame; columns it lacks are skipped."""
+        self.rows += len(df)
+        for col in self.distinct:
+            if col in df.columns:
+                values = df[col].dropna()
+                hashes = pd.util.hash_pandas_object(values, index=False)
+                self.distinct[col].add(hashes.to_numpy())
+                self.frequent[col].add(values)
+        for col, sketch in self.quantiles.items():
+            if col in df.columns:
+                if pd.api.types.is_datetime64_any_dtype(df[col]):
+                    self.dates.add(col)
+                    dates = df[col].to_numpy(dtype="datetime64[ms]")
+                    values = dates.astype(np.int64).astype(np.float64)
+                    values[np.isnat(dates)] = np.nan
+                else:
+                    values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                sketch.add(values)
+
+    def merge(self, other: "ColumnSketches") -> None:
+        """Add the rows sketched by another partition with the same columns."""
+        self.rows += other.rows
+        for col, sketch in self.distinct.items():
+            sketch.merge(other.distinct[col])
+        for col, summary in self.frequent.items():
+            summary.merge(other.frequent[col])
+        for col, sketch in self.quantiles.items():
+            sketch.merge(other.quantiles[col])
+        self.dates |= other.dates
+
+    def value_range(self, col: str) -> Optional[Tuple[Any, Any]]:
+        """Return the smallest and largest value of a range column."""
+        sketch = self.quantiles[col]
+        if sketch.count == 0:
+            return None
+        if col in self.dates:
+            return (
+                pd.Timestamp(int(sketch.min), unit="ms"),
+                pd.Timestamp(int(sketch.max), unit="ms"),
+            )
+        return sketch.min, sketch.max
+
+
+def sketch_partitions(
+    df: pd.DataFrame,
+    partitions: np.ndarray,
+    categories: Iterable[str],
+    ranges: Dict[str, float],
+) -> Dict[int, ColumnSketches]:
+    """Sketch each partition of a frame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Rows to sketch, e.g. one batch of a load.
+    partitions : np.ndarray
+        Integer partition key of each row.
+    categories : Iterable[str]
+        Columns whose distinct values are sketched.
+    ranges : Dict[str, float]
+        Columns whose value distribution is sketched, and its resolution.
+
+    Returns
+    -------
+    Dict[int, ColumnSketches]
+        Partition key to the sketches of its rows.
+    """
+    columns = [col for col in [*categories, *ranges] if col in df.columns]
+    sketches = {}
+    for key, rows in pd.Series(partitions).groupby(partitions).indices.items():
+        sketch = ColumnSketches(categories, ranges)
+        sketch.add(df[columns].take(rows))
+        sketches[int(key)] = sketch
+    return sketches